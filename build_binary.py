@@ -6,27 +6,43 @@ This script compiles shannot CLI to a single
 executable binary.
 
 Usage:
-    python build_binary.py [--debug] [--output-dir DIR]
+    python build_binary.py [--debug] [--pgo] [--compress {none,zstd}]
+                           [--package-mode {onefile,onedir}] [--output-dir DIR]
 
 Requirements:
     pip install nuitka ordered-set zstandard
 
 Output:
-    Binary will be created in dist/ directory by default.
+    Binary will be created in dist/ directory by default. In onedir mode the
+    binary lives in dist/shannot-<platform>.dist/ and a .tar.gz of that
+    directory is created alongside it.
 """
 
 import argparse
-import platform
+import os
 import shutil
 import subprocess
 import sys
+import time
+import tomllib
 from pathlib import Path
 
+# Linker/compiler messages that indicate a broken LTO toolchain rather than a
+# real build error; on these we retry once without LTO
+LTO_FAILURE_MARKERS = (
+    "bytecode stream",
+    "lto-wrapper",
+    "undefined reference to constant_bin_data",
+)
+
+# Builds slower than this get a hint to disable LTO in CI
+LTO_SLOW_BUILD_SECONDS = 5 * 60
+
 
 def get_platform_suffix() -> str:
     """Get platform-specific suffix for binary name."""
-    system = platform.system().lower()
-    machine = platform.machine().lower()
+    system = sys.platform  # "linux" or "darwin"
+    machine = os.uname().machine.lower()
 
     # Normalize machine architecture
     if machine in ("x86_64", "amd64"):
@@ -67,6 +83,13 @@ def check_requirements() -> None:
         print("✗ No C compiler found. Install gcc or clang.")
         sys.exit(1)
 
+    # ccache is optional, but Nuitka picks it up automatically when on PATH
+    # and it makes repeated builds much faster
+    if shutil.which("ccache"):
+        print("✓ ccache: enabled")
+    else:
+        print("⚠ ccache not found; rebuilds will recompile everything (apt install ccache)")
+
     # Check for source files
     source_dir = Path(__file__).parent / "shannot"
     if not source_dir.exists():
@@ -81,7 +104,59 @@ def check_requirements() -> None:
     print(f"✓ Source files found in {source_dir}")
 
 
-def build_binary(output_dir: Path, debug: bool = False) -> Path:
+def write_version_module(project_root: Path) -> Path:
+    """Freeze the pyproject.toml version into shannot/_version.py for the build.
+
+    The binary then reads its version from a plain module instead of querying
+    package metadata at runtime.
+    """
+    with open(project_root / "pyproject.toml", "rb") as f:
+        version = tomllib.load(f)["project"]["version"]
+
+    version_file = project_root / "shannot" / "_version.py"
+    version_file.write_text(
+        f'"""Generated by build_binary.py - do not edit."""\n\n__version__ = "{version}"\n'
+    )
+    print(f"✓ Version: {version}")
+    return version_file
+
+
+def run_nuitka(nuitka_args: list[str], cwd: Path) -> float:
+    """Run Nuitka, echoing its stderr, and return the elapsed time in seconds.
+
+    Raises subprocess.CalledProcessError (with stderr attached) on failure.
+    """
+    start = time.monotonic()
+    # Builds take minutes: pass progress and warnings through as they arrive,
+    # keeping a copy for the caller's LTO failure check
+    stderr_lines = []
+    # Compiler and linker diagnostics are not always UTF-8; a bad byte must
+    # not hide the real failure
+    with subprocess.Popen(
+        nuitka_args,
+        cwd=cwd,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        errors="replace",
+    ) as proc:
+        for line in proc.stderr:
+            sys.stderr.write(line)
+            sys.stderr.flush()
+            stderr_lines.append(line)
+    if proc.returncode != 0:
+        stderr = "".join(stderr_lines)
+        raise subprocess.CalledProcessError(proc.returncode, nuitka_args, stderr=stderr)
+    return time.monotonic() - start
+
+
+def build_binary(
+    output_dir: Path,
+    debug: bool = False,
+    pgo: bool = False,
+    compress: str = "none",
+    package_mode: str = "onefile",
+    jobs: int | None = None,
+) -> Path:
     """Build the shannot binary using Nuitka."""
     project_root = Path(__file__).parent
     source_dir = project_root / "shannot"
@@ -105,24 +180,32 @@ def build_binary(output_dir: Path, debug: bool = False) -> Path:
         str(entrypoint),
         # Output configuration
         "--standalone",
-        "--onefile",
-        # Custom tempdir for onefile extraction
-        "--onefile-tempdir-spec={CACHE_DIR}/shannot",
         f"--output-dir={output_dir}",
         f"--output-filename={binary_name}",
         # Include package data files (Nuitka auto-includes modules when compiling package dir)
         "--include-package-data=shannot",
-        # Include stub .py files as data (not code) - needed for runtime reading
-        f"--include-data-files={source_dir / 'stubs' / '_signal.py'}=shannot/stubs/_signal.py",
-        f"--include-data-files="
-        f"{source_dir / 'stubs' / 'subprocess.py'}=shannot/stubs/subprocess.py",
-        # Note: importlib.metadata.version() is resolved at compile time by Nuitka's
-        # pkg-resources plugin, so we don't need to bundle importlib.metadata
+        # Include stub .py files as data (not code) - needed for runtime reading.
+        # They are shipped as source on purpose: they run inside the PyPy 3.6
+        # sandbox, which cannot load bytecode compiled by the host CPython.
+        *(
+            f"--include-data-files={stub}=shannot/stubs/{stub.name}"
+            for stub in sorted((source_dir / "stubs").glob("*.py"))
+            if stub.name != "__init__.py"
+        ),
+        # Version is frozen into shannot/_version.py before compiling, so the
+        # binary never needs importlib.metadata or pkg_resources at runtime
+        "--nofollow-import-to=pkg_resources",
+        "--nofollow-import-to=setuptools",
         # Python flags
         "--python-flag=no_site",  # Don't include site-packages
         "--python-flag=-O",  # Optimize bytecode
         "--python-flag=-u",  # Unbuffered stdout/stderr
-        "--python-flag=-m",  # Run as module (for __main__.py)
+        # Package mode: compile __main__.py as shannot.__main__ so package-relative
+        # imports resolve. This is a compile-time switch; the binary enters the
+        # compiled __main__ directly and never goes through runpy. Compiling
+        # shannot/__main__.py as a plain script instead would put shannot/ on
+        # sys.path, letting shannot/queue.py shadow the stdlib queue module.
+        "--python-flag=-m",
         # Optional stdlib exclusions for smaller binary
         # These are not used by core shannot CLI
         "--nofollow-import-to=tkinter",
@@ -132,8 +215,23 @@ def build_binary(output_dir: Path, debug: bool = False) -> Path:
         "--nofollow-import-to=unittest",
         "--nofollow-import-to=pydoc",
         "--nofollow-import-to=doctest",
+        "--nofollow-import-to=pydoc_data",
+        "--nofollow-import-to=idlelib",
+        "--nofollow-import-to=lib2to3",
+        "--nofollow-import-to=ensurepip",
+        "--nofollow-import-to=venv",
+        "--nofollow-import-to=curses",
+        "--nofollow-import-to=logging.config",
+        "--nofollow-import-to=http.server",
+        "--nofollow-import-to=xmlrpc",
+        "--nofollow-import-to=xml.dom",
+        "--nofollow-import-to=xml.sax",
+        "--nofollow-import-to=html",
+        # Not excluded: email and http.client (urllib.request needs them for
+        # runtime/binary downloads), xml.parsers (platform.mac_ver via plistlib)
         # Build options
-        "--lto=yes",  # Link Time Optimization
+        "--lto=auto",  # Link Time Optimization where the toolchain supports it
+        f"--jobs={jobs or os.cpu_count() or 4}",  # Parallel C compilation and LTO
         "--assume-yes-for-downloads",
         "--remove-output",  # Clean build artifacts after success
         # Warning settings
@@ -152,19 +250,73 @@ def build_binary(output_dir: Path, debug: bool = False) -> Path:
     else:
         nuitka_args.append("--quiet")
 
+    # Onedir mode ships the .dist directory as-is, so there is no per-run
+    # extraction step at all; onefile unpacks into a cache dir on first run
+    if package_mode == "onefile":
+        nuitka_args.extend(
+            [
+                "--onefile",
+                # Custom tempdir for onefile extraction
+                "--onefile-tempdir-spec={CACHE_DIR}/shannot",
+            ]
+        )
+
+        # Onefile payload compression. Uncompressed payloads are larger but skip
+        # zstd decompression on every cold start. UPX is deliberately not offered:
+        # it double-compresses onefile binaries and breaks them (see 0.8.5).
+        if compress == "none":
+            nuitka_args.append("--onefile-no-compression")
+
+    # Profile-guided optimization: Nuitka builds an instrumented binary, runs it
+    # once with --pgo-args to collect a profile, then recompiles the C backend.
+    # `status` walks the CLI dispatch, config loading and runtime detection paths.
+    if pgo:
+        nuitka_args.extend(
+            [
+                "--pgo-c",
+                "--pgo-args=status",
+            ]
+        )
+
     # Platform-specific optimizations
     # Note: No Linux-specific options needed for CLI tools
 
     print("\nRunning Nuitka (this may take several minutes)...")
     print(f"Command: {' '.join(nuitka_args[:5])} ...")
 
+    version_file = write_version_module(project_root)
     try:
-        subprocess.run(nuitka_args, check=True, cwd=project_root)
+        try:
+            elapsed = run_nuitka(nuitka_args, project_root)
+        except subprocess.CalledProcessError as e:
+            if not any(marker in e.stderr for marker in LTO_FAILURE_MARKERS):
+                raise
+            print("\n⚠ LTO link failed (toolchain mismatch); retrying with --lto=no")
+            nuitka_args = ["--lto=no" if arg == "--lto=auto" else arg for arg in nuitka_args]
+            elapsed = run_nuitka(nuitka_args, project_root)
     except subprocess.CalledProcessError as e:
         print(f"\n✗ Build failed with exit code {e.returncode}")
         sys.exit(1)
+    finally:
+        # Source checkouts keep resolving the version from package metadata
+        version_file.unlink(missing_ok=True)
+
+    if elapsed > LTO_SLOW_BUILD_SECONDS and "--lto=auto" in nuitka_args:
+        print(
+            f"\n⚠ Build took {elapsed / 60:.1f} min; the LTO link phase is usually the "
+            "bottleneck. Consider --lto=no for CI builds."
+        )
 
-    binary_path = output_dir / binary_name
+    if package_mode == "onedir":
+        # Nuitka names the dist dir after the compiled package; give it the
+        # platform-suffixed name so artifacts from different builds don't collide
+        dist_dir = output_dir / f"{binary_name}.dist"
+        if dist_dir.exists():
+            shutil.rmtree(dist_dir)
+        (output_dir / f"{entrypoint.name}.dist").rename(dist_dir)
+        binary_path = dist_dir / binary_name
+    else:
+        binary_path = output_dir / binary_name
 
     if not binary_path.exists():
         print(f"✗ Binary not found at expected location: {binary_path}")
@@ -180,6 +332,15 @@ def build_binary(output_dir: Path, debug: bool = False) -> Path:
     print(f"  Binary: {binary_path}")
     print(f"  Size: {size_mb:.1f} MB")
 
+    if package_mode == "onedir":
+        archive = shutil.make_archive(
+            str(output_dir / binary_name),
+            "gztar",
+            root_dir=output_dir,
+            base_dir=binary_path.parent.name,
+        )
+        print(f"  Archive: {archive}")
+
     return binary_path
 
 
@@ -242,6 +403,31 @@ def main() -> int:
         action="store_true",
         help="Enable debug output from Nuitka",
     )
+    parser.add_argument(
+        "--pgo",
+        action="store_true",
+        help="Enable profile-guided optimization of the C backend (slower build)",
+    )
+    parser.add_argument(
+        "--compress",
+        choices=["none", "zstd"],
+        default="none",
+        help="Onefile payload compression: none for fastest startup, "
+        "zstd for a smaller download (default: none)",
+    )
+    parser.add_argument(
+        "--package-mode",
+        choices=["onefile", "onedir"],
+        default="onefile",
+        help="onefile: single self-extracting binary; onedir: directory + .tar.gz "
+        "with no extraction on startup (default: onefile)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Parallel C compiler jobs (default: CPU count)",
+    )
     parser.add_argument(
         "--skip-tests",
         action="store_true",
@@ -257,7 +443,14 @@ def main() -> int:
     args.output_dir.mkdir(parents=True, exist_ok=True)
 
     # Build the binary
-    binary_path = build_binary(args.output_dir, debug=args.debug)
+    binary_path = build_binary(
+        args.output_dir,
+        debug=args.debug,
+        pgo=args.pgo,
+        compress=args.compress,
+        package_mode=args.package_mode,
+        jobs=args.jobs,
+    )
 
     # Test the binary
     if not args.skip_tests:
@@ -274,7 +467,11 @@ def main() -> int:
     print(f"  {binary_path} setup")
     print(f"  {binary_path} status")
     print("\nTo install system-wide:")
-    print(f"  sudo cp {binary_path} /usr/local/bin/shannot")
+    if args.package_mode == "onedir":
+        print(f"  sudo cp -r {binary_path.parent} /opt/shannot")
+        print(f"  sudo ln -s /opt/shannot/{binary_path.name} /usr/local/bin/shannot")
+    else:
+        print(f"  sudo cp {binary_path} /usr/local/bin/shannot")
 
     return 0
 
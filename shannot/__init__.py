@@ -1,3 +1,23 @@
-from .virtualizedproc import VirtualizedProc as VirtualizedProc
-from .virtualizedproc import sigerror as sigerror
-from .virtualizedproc import signature as signature
+from __future__ import annotations
+
+# Defined here rather than imported, so `import shannot` (and with it every CLI
+# start) does not load typing; type checkers honour this spelling as well
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .virtualizedproc import VirtualizedProc as VirtualizedProc
+    from .virtualizedproc import sigerror as sigerror
+    from .virtualizedproc import signature as signature
+
+__all__ = ["VirtualizedProc", "sigerror", "signature"]
+
+
+def __getattr__(name: str):
+    # Resolved on first use so that importing a submodule such as shannot.cli
+    # does not load the sandbox process machinery
+    if name in __all__:
+        from . import virtualizedproc
+
+        value = getattr(virtualizedproc, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,17 +13,21 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import base64
 import os
+import select
+import signal
 import sys
 import termios
+import time
 import tty
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from .session import Session
 
+from .audit import log_approval_decision, log_execution_completed, log_execution_started
 from .config import DangerLevel, classify_command_danger, load_config
+from .pending_deletion import format_size, summarize_deletions
+from .pending_write import PendingWrite
+from .session import Session, execute_session
 
 # Danger level color codes for TUI display
 DANGER_COLORS = {
@@ -34,6 +38,9 @@ DANGER_COLORS = {
 }
 COLOR_RESET = "\033[0m"
 
+# Pending writes larger than this get a warning marker in the TUI
+LARGE_WRITE_BYTES = 5 * 1024 * 1024  # 5 MB
+
 
 # ==============================================================================
 # Action - uniform return type from views
@@ -44,7 +51,7 @@ COLOR_RESET = "\033[0m"
 class Action:
     """Action returned from views to be handled by main loop."""
 
-    name: str  # "execute", "reject", "view", "back", "quit"
+    name: str  # "execute", "reject", "view", "back", "quit", "ignore"
     sessions: list[Session] = field(default_factory=list)
 
 
@@ -53,25 +60,47 @@ class Action:
 # ==============================================================================
 
 
-def read_single_key() -> str:
-    """Read a single keypress, handling escape sequences properly."""
-    import select
+def enter_raw_mode(fd: int) -> list:
+    """
+    Switch the terminal to raw input and return the previous settings.
 
-    fd = sys.stdin.fileno()
+    Output processing is left on so rendered newlines still return the
+    carriage. Restore with exit_raw_mode().
+    """
     old = termios.tcgetattr(fd)
-    try:
-        tty.setraw(fd)
-        # Use os.read() directly to bypass Python's buffered I/O
-        ch = os.read(fd, 1).decode("utf-8", errors="replace")
-        if ch == "\x1b":
-            # Read escape sequence - arrow keys are ESC [ A/B/C/D
-            while select.select([fd], [], [], 0.02)[0]:
-                ch += os.read(fd, 1).decode("utf-8", errors="replace")
-                if len(ch) >= 4:
-                    break
-        return ch
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+    tty.setraw(fd)
+    mode = termios.tcgetattr(fd)
+    mode[tty.OFLAG] |= termios.OPOST
+    termios.tcsetattr(fd, termios.TCSANOW, mode)
+    return old
+
+
+def exit_raw_mode(fd: int, old: list) -> None:
+    """Restore terminal settings saved by enter_raw_mode()."""
+    termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+
+def read_single_key(fd: int) -> str:
+    """
+    Read a single keypress, handling escape sequences properly.
+
+    The terminal must already be in raw mode (see enter_raw_mode()), so
+    no terminal attributes are touched per key.
+    """
+    # Use os.read() directly to bypass Python's buffered I/O
+    ch = os.read(fd, 1).decode("utf-8", errors="replace")
+    if ch == "\x1b":
+        # Read escape sequence - arrow keys are ESC [ A/B/C/D
+        while select.select([fd], [], [], 0.02)[0]:
+            ch += os.read(fd, 1).decode("utf-8", errors="replace")
+            if len(ch) >= 4:
+                break
+    return ch
+
+
+def key_pending(fd: int) -> bool:
+    """Return True if another keypress is already waiting to be read."""
+    return bool(select.select([fd], [], [], 0)[0])
 
 
 def clear_screen():
@@ -90,10 +119,77 @@ def show_cursor():
     sys.stdout.write("\033[?25h")
 
 
+def disable_line_wrap():
+    sys.stdout.write("\033[?7l")
+
+
+def enable_line_wrap():
+    sys.stdout.write("\033[?7h")
+
+
+def full_frame(lines: list[str]) -> str:
+    """Terminal output that clears the screen and draws a whole frame."""
+    return "\033[2J\033[H" + "\n".join(lines) + "\n"
+
+
+def changed_lines_frame(old: list[str], new: list[str]) -> str:
+    """
+    Terminal output that redraws only the lines differing from the previous frame.
+
+    Assumes line wrapping is disabled, so frame line i sits on screen row i + 1.
+    """
+    parts = [
+        f"\033[{i + 1};1H\033[2K{line}"
+        for i, line in enumerate(new)
+        if i >= len(old) or old[i] != line
+    ]
+    if len(new) < len(old):
+        # Clear rows left over from the longer previous frame
+        parts.append(f"\033[{len(new) + 1};1H\033[J")
+    return "".join(parts)
+
+
+def write_frame(text: str) -> None:
+    """
+    Send a frame straight to the terminal, bypassing sys.stdout's text layer.
+
+    Anything still queued on sys.stdout is flushed first to keep output in order.
+    """
+    sys.stdout.flush()
+    data = memoryview(text.encode("utf-8"))
+    fd = sys.stdout.fileno()
+    while data:
+        data = data[os.write(fd, data) :]
+
+
+# Terminal size cache, only used while run_tui() handles SIGWINCH to invalidate it
+_track_resize = False
+_term_size: tuple[int, int] | None = None
+
+
+def _on_resize(signum, frame) -> None:
+    global _term_size
+    _term_size = None
+
+
+def pending_write_size(write_data: dict) -> int | None:
+    """Decoded size of a pending write's content, or None if it is not valid base64."""
+    try:
+        return len(base64.b64decode(write_data.get("content_b64", "")))
+    except (ValueError, TypeError):
+        return None
+
+
 def get_terminal_size() -> tuple[int, int]:
-    """Return (rows, cols)."""
+    """Return (rows, cols), cached between SIGWINCHs while the TUI is running."""
+    global _term_size
+    if _term_size is not None:
+        return _term_size
     size = os.get_terminal_size()
-    return size.lines, size.columns
+    result = (size.lines, size.columns)
+    if _track_resize:
+        _term_size = result
+    return result
 
 
 # ==============================================================================
@@ -104,8 +200,8 @@ def get_terminal_size() -> tuple[int, int]:
 class View:
     """Base class for TUI views."""
 
-    def render(self) -> None:
-        """Render the view to the terminal."""
+    def render(self) -> list[str]:
+        """Return the lines of the view's current frame."""
         raise NotImplementedError
 
     def handle_key(self, key: str) -> Action | View | None:
@@ -114,6 +210,7 @@ class View:
 
         Returns:
             An Action to execute, a new View to switch to, or None to stay on this view.
+            Action("ignore") means the key changed nothing and no redraw is needed.
         """
         raise NotImplementedError
 
@@ -128,59 +225,79 @@ class SessionListView(View):
 
     def __init__(self, sessions: list[Session] | None = None):
         if sessions is None:
-            from .session import Session
-
             sessions = Session.list_pending()
         self.sessions = sessions
         self.cursor = 0
-        self.selected: set[int] = set()
+        self.scroll = 0
+        self.selected = 0  # Bitmap: bit i is set when sessions[i] is selected
+        # Row text after the pointer/marker prefix; sessions don't change per view
+        self._rows = [self._format_row(session) for session in sessions]
+
+    @staticmethod
+    def _format_row(session: Session) -> str:
+        """Format the cursor-independent part of a session row."""
+        cmd_count = len(session.commands)
+        write_count = len(session.pending_writes)
+        delete_count = len(session.pending_deletions)
+        date = session.created_at[:10]
+        name = session.name[:30]
+
+        # Show counts
+        counts = f"{cmd_count:>2} cmds"
+        if write_count:
+            counts += f", {write_count} writes"
+        if delete_count:
+            counts += f", {delete_count} deletes"
+
+        # Show remote target if present
+        remote_tag = ""
+        if session.is_remote():
+            remote_tag = f" \033[33m@{session.target}\033[0m"
 
-    def render(self) -> None:
-        clear_screen()
+        return f"{name:<32} ({counts}){remote_tag} {date}"
+
+    def render(self) -> list[str]:
         rows, cols = get_terminal_size()
 
-        print("\033[1m Pending Sessions \033[0m")
-        print()
+        lines = ["\033[1m Pending Sessions \033[0m", ""]
 
         if not self.sessions:
-            print(" No pending sessions.")
-            print()
-            print(" \033[90mPress q to quit\033[0m")
-            return
+            lines += [" No pending sessions.", "", " \033[90mPress q to quit\033[0m"]
+            return lines
 
-        for i, session in enumerate(self.sessions):
-            marker = "\033[32m*\033[0m" if i in self.selected else " "
-            pointer = "\033[36m>\033[0m" if i == self.cursor else " "
-
-            cmd_count = len(session.commands)
-            write_count = len(session.pending_writes)
-            delete_count = len(session.pending_deletions)
-            date = session.created_at[:10]
-            name = session.name[:30]
+        visible_rows = rows - 6
+        if visible_rows < 3:
+            visible_rows = 3
 
-            # Show counts
-            counts = f"{cmd_count:>2} cmds"
-            if write_count:
-                counts += f", {write_count} writes"
-            if delete_count:
-                counts += f", {delete_count} deletes"
+        # Scroll only as far as needed to keep the cursor on screen
+        if self.cursor < self.scroll:
+            self.scroll = self.cursor
+        elif self.cursor >= self.scroll + visible_rows:
+            self.scroll = self.cursor - visible_rows + 1
+        visible = self._rows[self.scroll : self.scroll + visible_rows]
 
-            # Show remote target if present
-            remote_tag = ""
-            if session.is_remote():
-                remote_tag = f" \033[33m@{session.target}\033[0m"
+        for i, row in enumerate(visible, self.scroll):
+            marker = "\033[32m*\033[0m" if self.selected >> i & 1 else " "
+            pointer = "\033[36m>\033[0m" if i == self.cursor else " "
+            lines.append(f" {pointer}{marker} {row}")
 
-            print(f" {pointer}{marker} {name:<32} ({counts}){remote_tag} {date}")
+        lines += [
+            "",
+            " \033[90m[Up/Down] move  [Space] select  [a]ll  [n]one\033[0m",
+            " \033[90m[Enter] review  [x] execute  [r] reject  [q] quit\033[0m",
+        ]
+        return lines
 
-        print()
-        print(" \033[90m[Up/Down] move  [Space] select  [a]ll  [n]one\033[0m")
-        print(" \033[90m[Enter] review  [x] execute  [r] reject  [q] quit\033[0m")
+    def _selected_sessions(self) -> list[Session]:
+        """Selected sessions in list order."""
+        selected = self.selected
+        return [s for i, s in enumerate(self.sessions) if selected >> i & 1]
 
     def handle_key(self, key: str) -> Action | View | None:
         if not self.sessions:
             if key in ("q", "\x03"):
                 return Action("quit")
-            return None
+            return Action("ignore")
 
         if key in ("q", "\x03"):
             return Action("quit")
@@ -192,30 +309,30 @@ class SessionListView(View):
             self.cursor = (self.cursor - 1) % len(self.sessions)
 
         elif key == " ":  # Toggle select
-            if self.cursor in self.selected:
-                self.selected.discard(self.cursor)
-            else:
-                self.selected.add(self.cursor)
+            self.selected ^= 1 << self.cursor
 
         elif key == "a":  # Select all
-            self.selected = set(range(len(self.sessions)))
+            self.selected = (1 << len(self.sessions)) - 1
 
         elif key == "n":  # Select none
-            self.selected.clear()
+            self.selected = 0
 
         elif key == "\r":  # Enter - review current
             return Action("view", [self.sessions[self.cursor]])
 
         elif key == "x":  # Execute selected
             if self.selected:
-                sessions = [self.sessions[i] for i in sorted(self.selected)]
+                sessions = self._selected_sessions()
                 return Action("execute", sessions)
 
         elif key == "r":  # Reject selected
             if self.selected:
-                sessions = [self.sessions[i] for i in sorted(self.selected)]
+                sessions = self._selected_sessions()
                 return Action("reject", sessions)
 
+        else:  # Unbound key: nothing changed, skip the redraw
+            return Action("ignore")
+
         return None
 
 
@@ -230,36 +347,51 @@ class SessionDetailView(View):
     def __init__(self, session: Session):
         self.session = session
         self.scroll = 0
-
-    def render(self) -> None:
-        clear_screen()
+        self._command_colors: list[str] | None = None
+        # Sizes of the pending writes shown in the summary, decoded once
+        self._write_sizes = [pending_write_size(w) for w in session.pending_writes[:3]]
+
+    def _get_command_colors(self) -> list[str]:
+        """Color code per command, classified once rather than on every redraw."""
+        if self._command_colors is None:
+            profile = load_config().profile
+            self._command_colors = [
+                DANGER_COLORS[classify_command_danger(cmd, profile)]
+                for cmd in self.session.commands
+            ]
+        return self._command_colors
+
+    def render(self) -> list[str]:
         rows, cols = get_terminal_size()
 
         s = self.session
-        print(f"\033[1m Session: {s.name} \033[0m")
-        print(f" ID: {s.id}")
-        print(f" Script: {s.script_path}")
+        lines = [
+            f"\033[1m Session: {s.name} \033[0m",
+            f" ID: {s.id}",
+            f" Script: {s.script_path}",
+        ]
         if s.is_remote():
-            print(f" Target: \033[33m{s.target}\033[0m")
-        print(f" Created: {s.created_at}")
-        print()
+            lines.append(f" Target: \033[33m{s.target}\033[0m")
+        lines.append(f" Created: {s.created_at}")
+        lines.append("")
 
         if s.analysis:
-            print(" \033[1mAnalysis:\033[0m")
+            lines.append(" \033[1mAnalysis:\033[0m")
             for line in s.analysis.split("\n")[:5]:
-                print(f"   {line[: cols - 4]}")
-            print()
+                lines.append(f"   {line[: cols - 4]}")
+            lines.append("")
 
-        print(f" \033[1mCommands ({len(s.commands)}):\033[0m")
+        commands = s.commands
+        n_commands = len(commands)
+        lines.append(f" \033[1mCommands ({n_commands}):\033[0m")
 
         # Scrollable command list
         visible_rows = rows - 18 - (3 if s.pending_writes else 0)
         if visible_rows < 3:
             visible_rows = 3
-        visible_cmds = s.commands[self.scroll : self.scroll + visible_rows]
+        visible_cmds = commands[self.scroll : self.scroll + visible_rows]
 
-        # Load profile once for danger classification
-        profile = load_config().profile
+        command_colors = self._get_command_colors()
 
         for i, cmd in enumerate(visible_cmds):
             idx = self.scroll + i + 1
@@ -267,44 +399,36 @@ class SessionDetailView(View):
             if len(cmd) > cols - 10:
                 display += "..."
 
-            # Classify and color the command
-            danger = classify_command_danger(cmd, profile)
-            color = DANGER_COLORS.get(danger, "")
+            # Color the command by danger level
+            color = command_colors[idx - 1]
             reset = COLOR_RESET if color else ""
-            print(f"   {idx:>3}. {color}{display}{reset}")
+            lines.append(f"   {idx:>3}. {color}{display}{reset}")
 
-        remaining = len(s.commands) - self.scroll - len(visible_cmds)
+        remaining = n_commands - self.scroll - len(visible_cmds)
         if remaining > 0:
-            print(f"       ... ({remaining} more)")
+            lines.append(f"       ... ({remaining} more)")
 
         # Show pending writes summary
-        if s.pending_writes:
-            import base64
-
-            large_file_threshold = 5 * 1024 * 1024  # 5 MB
-            print()
-            print(f" \033[1mFile Writes ({len(s.pending_writes)}):\033[0m")
+        n_writes = len(s.pending_writes)
+        if n_writes:
+            lines.append("")
+            lines.append(f" \033[1mFile Writes ({n_writes}):\033[0m")
             for i, write_data in enumerate(s.pending_writes[:3]):
                 path = write_data.get("path", "?")
                 remote = " \033[33m[remote]\033[0m" if write_data.get("remote") else ""
-                # Check size for large file warning
-                try:
-                    size = len(base64.b64decode(write_data.get("content_b64", "")))
-                    warn = " \033[33m⚠ large\033[0m" if size > large_file_threshold else ""
-                except (ValueError, TypeError):
-                    warn = ""
-                print(f"   {i + 1:>3}. {path}{remote}{warn}")
-            if len(s.pending_writes) > 3:
-                print(f"       ... ({len(s.pending_writes) - 3} more)")
+                # Large file warning
+                size = self._write_sizes[i]
+                warn = " \033[33m⚠ large\033[0m" if size and size > LARGE_WRITE_BYTES else ""
+                lines.append(f"   {i + 1:>3}. {path}{remote}{warn}")
+            if n_writes > 3:
+                lines.append(f"       ... ({n_writes - 3} more)")
 
         # Show pending deletions summary (collapsed by directory)
         if s.pending_deletions:
-            from .pending_deletion import format_size, summarize_deletions
-
-            print()
+            lines.append("")
             total_size = sum(d.get("size", 0) for d in s.pending_deletions)
             count = len(s.pending_deletions)
-            print(f" \033[1mDeletions ({count} items, {format_size(total_size)}):\033[0m")
+            lines.append(f" \033[1mDeletions ({count} items, {format_size(total_size)}):\033[0m")
 
             # Group by root directory
             summaries = summarize_deletions(s.pending_deletions)
@@ -322,18 +446,19 @@ class SessionDetailView(View):
                 detail = ", ".join(parts)
 
                 size_str = format_size(size)
-                print(f"   {i + 1:>3}. \033[31mDELETE\033[0m {root} ({detail}, {size_str})")
+                lines.append(f"   {i + 1:>3}. \033[31mDELETE\033[0m {root} ({detail}, {size_str})")
             if len(summaries) > 3:
-                print(f"       ... ({len(summaries) - 3} more directories)")
+                lines.append(f"       ... ({len(summaries) - 3} more directories)")
 
-        print()
+        lines.append("")
         help_text = " \033[90m[Up/Down] scroll  [v] view script"
         if s.pending_writes:
             help_text += "  [w] view writes"
         if s.pending_deletions:
             help_text += "  [d] view deletes"
         help_text += "  [x] execute  [r] reject  [Esc] back\033[0m"
-        print(help_text)
+        lines.append(help_text)
+        return lines
 
     def handle_key(self, key: str) -> Action | View | None:
         rows, _ = get_terminal_size()
@@ -364,6 +489,9 @@ class SessionDetailView(View):
         elif key == "r":
             return Action("reject", [self.session])
 
+        else:  # Unbound key: nothing changed, skip the redraw
+            return Action("ignore")
+
         return None
 
 
@@ -378,28 +506,39 @@ class ScriptView(View):
     def __init__(self, session: Session):
         self.session = session
         self.scroll = 0
-        self.content = session.load_script() or "(Script content not available)"
-        self.lines = self.content.split("\n")
-
-    def render(self) -> None:
-        clear_screen()
+        self._lines: list[str] | None = None
+        # Numbered, width-truncated lines; rebuilt only when the terminal width changes
+        self._display: list[str] = []
+        self._display_cols = -1
+
+    @property
+    def lines(self) -> list[str]:
+        """Script lines, read from disk on first use rather than on entering the view."""
+        if self._lines is None:
+            content = self.session.load_script() or "(Script content not available)"
+            self._lines = content.splitlines()
+        return self._lines
+
+    def render(self) -> list[str]:
         rows, cols = get_terminal_size()
 
-        print(f"\033[1m Script: {self.session.script_path} \033[0m")
-        print()
+        lines = [f"\033[1m Script: {self.session.script_path} \033[0m", ""]
 
         visible_rows = rows - 6
         if visible_rows < 3:
             visible_rows = 3
-        visible_lines = self.lines[self.scroll : self.scroll + visible_rows]
 
-        for i, line in enumerate(visible_lines):
-            lineno = self.scroll + i + 1
-            display = line[: cols - 8]
-            print(f" \033[90m{lineno:>4}\033[0m {display}")
+        if cols != self._display_cols:
+            self._display = [
+                f" \033[90m{lineno:>4}\033[0m {line[: cols - 8]}"
+                for lineno, line in enumerate(self.lines, 1)
+            ]
+            self._display_cols = cols
+        lines.extend(self._display[self.scroll : self.scroll + visible_rows])
 
-        print()
-        print(" \033[90m[Up/Down] scroll  [x] execute  [r] reject  [Esc] back\033[0m")
+        lines.append("")
+        lines.append(" \033[90m[Up/Down] scroll  [x] execute  [r] reject  [Esc] back\033[0m")
+        return lines
 
     def handle_key(self, key: str) -> Action | None:
         rows, _ = get_terminal_size()
@@ -421,6 +560,9 @@ class ScriptView(View):
         elif key == "r":
             return Action("reject", [self.session])
 
+        else:  # Unbound key: nothing changed, skip the redraw
+            return Action("ignore")
+
         return None
 
 
@@ -435,19 +577,33 @@ class PendingWritesListView(View):
     def __init__(self, session: Session):
         self.session = session
         self.cursor = 0
+        # (warning marker, size text) per write, decoded once rather than every frame
+        self._size_columns = [self._format_size(w) for w in session.pending_writes]
+
+    @staticmethod
+    def _format_size(write_data: dict) -> tuple[str, str]:
+        size = pending_write_size(write_data)
+        if size is None:
+            return "  ", "?"  # Invalid base64 data
+        if size >= 1024 * 1024:
+            size_str = f"{size / (1024 * 1024):.1f} MB"
+        elif size >= 1024:
+            size_str = f"{size / 1024:.1f} KB"
+        else:
+            size_str = f"{size:,} B"
+        warn = "\033[33m⚠\033[0m " if size > LARGE_WRITE_BYTES else "  "
+        return warn, size_str
 
-    def render(self) -> None:
-        clear_screen()
+    def render(self) -> list[str]:
         rows, cols = get_terminal_size()
 
-        print(f"\033[1m Pending Writes: {self.session.name} \033[0m")
-        print()
+        lines = [f"\033[1m Pending Writes: {self.session.name} \033[0m", ""]
 
         if not self.session.pending_writes:
-            print(" No pending writes.")
-            print()
-            print(" \033[90m[Esc] back\033[0m")
-            return
+            lines.append(" No pending writes.")
+            lines.append("")
+            lines.append(" \033[90m[Esc] back\033[0m")
+            return lines
 
         visible_rows = rows - 8
         if visible_rows < 3:
@@ -456,50 +612,28 @@ class PendingWritesListView(View):
         start = max(0, self.cursor - visible_rows // 2)
         visible = self.session.pending_writes[start : start + visible_rows]
 
-        large_file_threshold = 5 * 1024 * 1024  # 5 MB
-
         for i, write_data in enumerate(visible):
             idx = start + i
             pointer = "\033[36m>\033[0m" if idx == self.cursor else " "
             path = write_data.get("path", "?")
             remote = "\033[33m[R]\033[0m" if write_data.get("remote") else "   "
-
-            # Calculate size
-            content_b64 = write_data.get("content_b64", "")
-            import base64
-
-            try:
-                size = len(base64.b64decode(content_b64))
-                if size >= 1024 * 1024:
-                    size_str = f"{size / (1024 * 1024):.1f} MB"
-                elif size >= 1024:
-                    size_str = f"{size / 1024:.1f} KB"
-                else:
-                    size_str = f"{size:,} B"
-            except (ValueError, TypeError):
-                size = 0
-                size_str = "?"  # Invalid base64 data
-
-            # Large file warning
-            if size > large_file_threshold:
-                warn = "\033[33m⚠\033[0m "
-            else:
-                warn = "  "
+            warn, size_str = self._size_columns[idx]
 
             display_path = path[: cols - 30]
             if len(path) > cols - 30:
                 display_path += "..."
 
-            print(f" {pointer} {warn}{remote} {display_path:<50} {size_str:>10}")
+            lines.append(f" {pointer} {warn}{remote} {display_path:<50} {size_str:>10}")
 
-        print()
-        print(" \033[90m[Up/Down] select  [Enter] view diff  [Esc] back\033[0m")
+        lines.append("")
+        lines.append(" \033[90m[Up/Down] select  [Enter] view diff  [Esc] back\033[0m")
+        return lines
 
     def handle_key(self, key: str) -> Action | View | None:
         if not self.session.pending_writes:
             if key in ("b", "\x1b"):
                 return Action("back")
-            return None
+            return Action("ignore")
 
         if key in ("b", "\x1b"):
             return Action("back")
@@ -513,6 +647,9 @@ class PendingWritesListView(View):
         elif key == "\r":
             return PendingWriteDiffView(self.session, self.cursor)
 
+        else:  # Unbound key: nothing changed, skip the redraw
+            return Action("ignore")
+
         return None
 
 
@@ -528,21 +665,20 @@ class PendingDeletionsListView(View):
         self.session = session
         self.cursor = 0
 
-    def render(self) -> None:
-        clear_screen()
+    def render(self) -> list[str]:
         rows, cols = get_terminal_size()
 
-        from .pending_deletion import format_size
-
         total_size = sum(d.get("size", 0) for d in self.session.pending_deletions)
-        print(f"\033[1m Pending Deletions: {self.session.name} ({format_size(total_size)}) \033[0m")
-        print()
+        lines = [
+            f"\033[1m Pending Deletions: {self.session.name} ({format_size(total_size)}) \033[0m",
+            "",
+        ]
 
         if not self.session.pending_deletions:
-            print(" No pending deletions.")
-            print()
-            print(" \033[90m[Esc] back\033[0m")
-            return
+            lines.append(" No pending deletions.")
+            lines.append("")
+            lines.append(" \033[90m[Esc] back\033[0m")
+            return lines
 
         visible_rows = rows - 8
         if visible_rows < 3:
@@ -567,20 +703,21 @@ class PendingDeletionsListView(View):
                 display_path += "..."
 
             line = f" {pointer} \033[31mDEL\033[0m {type_icon} {remote} {display_path:<50}"
-            print(f"{line} {size_str:>10}")
+            lines.append(f"{line} {size_str:>10}")
 
-        print()
+        lines.append("")
         remaining = len(self.session.pending_deletions) - start - len(visible)
         if remaining > 0:
-            print(f" ... and {remaining} more")
-        print()
-        print(" \033[90m[Up/Down] scroll  [Esc] back\033[0m")
+            lines.append(f" ... and {remaining} more")
+        lines.append("")
+        lines.append(" \033[90m[Up/Down] scroll  [Esc] back\033[0m")
+        return lines
 
     def handle_key(self, key: str) -> Action | View | None:
         if not self.session.pending_deletions:
             if key in ("b", "\x1b"):
                 return Action("back")
-            return None
+            return Action("ignore")
 
         if key in ("b", "\x1b"):
             return Action("back")
@@ -591,6 +728,9 @@ class PendingDeletionsListView(View):
         elif key in ("k", "\x1b[A"):
             self.cursor = max(self.cursor - 1, 0)
 
+        else:  # Unbound key: nothing changed, skip the redraw
+            return Action("ignore")
+
         return None
 
 
@@ -611,21 +751,17 @@ class PendingWriteDiffView(View):
 
     def _build_diff(self):
         """Build diff lines from write data."""
-        from .pending_write import PendingWrite
-
         pending = PendingWrite.from_dict(self.write_data)
         diff = pending.get_diff()
         self.diff_lines = diff.splitlines()
         self.path = pending.path
         self.is_remote = pending.remote
 
-    def render(self) -> None:
-        clear_screen()
+    def render(self) -> list[str]:
         rows, cols = get_terminal_size()
 
         remote_tag = " \033[33m[remote]\033[0m" if self.is_remote else ""
-        print(f"\033[1m Write: {self.path}{remote_tag} \033[0m")
-        print()
+        lines = [f"\033[1m Write: {self.path}{remote_tag} \033[0m", ""]
 
         visible_rows = rows - 6
         if visible_rows < 3:
@@ -635,16 +771,17 @@ class PendingWriteDiffView(View):
         for line in visible_lines:
             # Colorize diff output
             if line.startswith("+") and not line.startswith("+++"):
-                print(f" \033[32m{line[: cols - 2]}\033[0m")
+                lines.append(f" \033[32m{line[: cols - 2]}\033[0m")
             elif line.startswith("-") and not line.startswith("---"):
-                print(f" \033[31m{line[: cols - 2]}\033[0m")
+                lines.append(f" \033[31m{line[: cols - 2]}\033[0m")
             elif line.startswith("@@"):
-                print(f" \033[36m{line[: cols - 2]}\033[0m")
+                lines.append(f" \033[36m{line[: cols - 2]}\033[0m")
             else:
-                print(f" {line[: cols - 2]}")
+                lines.append(f" {line[: cols - 2]}")
 
-        print()
-        print(" \033[90m[Up/Down] scroll  [Esc] back\033[0m")
+        lines.append("")
+        lines.append(" \033[90m[Up/Down] scroll  [Esc] back\033[0m")
+        return lines
 
     def handle_key(self, key: str) -> Action | None:
         rows, _ = get_terminal_size()
@@ -660,6 +797,9 @@ class PendingWriteDiffView(View):
         elif key in ("k", "\x1b[A"):
             self.scroll = max(self.scroll - 1, 0)
 
+        else:  # Unbound key: nothing changed, skip the redraw
+            return Action("ignore")
+
         return None
 
 
@@ -674,11 +814,11 @@ class ConfirmView(View):
     def __init__(self, message: str, sessions: list[Session]):
         self.message = message
         self.sessions = sessions
+        # Nothing on this screen changes while it is shown, so build it once
+        self._lines = self._build_lines()
 
-    def render(self) -> None:
-        clear_screen()
-        print(f"\033[1m {self.message} \033[0m")
-        print()
+    def _build_lines(self) -> list[str]:
+        lines = [f"\033[1m {self.message} \033[0m", ""]
 
         for s in self.sessions:
             counts = f"{len(s.commands)} commands"
@@ -686,17 +826,22 @@ class ConfirmView(View):
                 counts += f", {len(s.pending_writes)} writes"
             if s.pending_deletions:
                 counts += f", {len(s.pending_deletions)} deletes"
-            print(f"   - {s.name} ({counts})")
+            lines.append(f"   - {s.name} ({counts})")
+
+        lines.append("")
+        lines.append(" \033[90m[y] yes  [n] no\033[0m")
+        return lines
 
-        print()
-        print(" \033[90m[y] yes  [n] no\033[0m")
+    def render(self) -> list[str]:
+        return self._lines
 
     def handle_key(self, key: str) -> Action | None:
         if key == "y":
             return Action("confirmed", self.sessions)
         elif key in ("n", "\x1b", "q"):
             return Action("cancelled")
-        return None
+        else:  # Unbound key: nothing changed, skip the redraw
+            return Action("ignore")
 
 
 # ==============================================================================
@@ -710,23 +855,23 @@ class ResultView(View):
     def __init__(self, results: list[tuple[Session, int]]):
         self.results = results
         self.cursor = 0
-
-    def render(self) -> None:
-        clear_screen()
-        print("\033[1m Execution Results \033[0m")
-        print()
-
-        for i, (session, code) in enumerate(self.results):
-            pointer = "\033[36m>\033[0m" if i == self.cursor else " "
-            if code == 0:
-                status = "\033[32m✓\033[0m"
-            else:
-                status = "\033[31m✗\033[0m"
-            print(f" {pointer} {status} {session.name:<30} exit {code}")
-
-        print()
+        # Only the cursor moves in this view; rows (minus pointer) and footer are fixed
+        self._rows = [
+            f"{self._format_status(code)} {session.name:<30} exit {code}"
+            for session, code in results
+        ]
+        self._footer = self._build_footer()
+
+    @staticmethod
+    def _format_status(code: int) -> str:
+        if code == 0:
+            return "\033[32m✓\033[0m"
+        return "\033[31m✗\033[0m"
+
+    def _build_footer(self) -> list[str]:
+        lines = [""]
         success = sum(1 for _, c in self.results if c == 0)
-        print(f" {success}/{len(self.results)} succeeded")
+        lines.append(f" {success}/{len(self.results)} succeeded")
 
         # Collect and display write conflicts
         conflicts = []
@@ -737,16 +882,29 @@ class ResultView(View):
                         conflicts.append(write.get("path", "unknown"))
 
         if conflicts:
-            print()
+            lines.append("")
             noun = "conflict" if len(conflicts) == 1 else "conflicts"
-            print(f"\033[33m⚠ {len(conflicts)} write {noun} — file changed since dry-run\033[0m")
+            lines.append(
+                f"\033[33m⚠ {len(conflicts)} write {noun} — file changed since dry-run\033[0m"
+            )
             for path in conflicts[:3]:
-                print(f"  {path}")
+                lines.append(f"  {path}")
             if len(conflicts) > 3:
-                print(f"  ... and {len(conflicts) - 3} more")
+                lines.append(f"  ... and {len(conflicts) - 3} more")
 
-        print()
-        print(" \033[90m[Up/Down] select  [v] view output  [Esc] back  [q] quit\033[0m")
+        lines.append("")
+        lines.append(" \033[90m[Up/Down] select  [v] view output  [Esc] back  [q] quit\033[0m")
+        return lines
+
+    def render(self) -> list[str]:
+        lines = ["\033[1m Execution Results \033[0m", ""]
+
+        for i, row in enumerate(self._rows):
+            pointer = "\033[36m>\033[0m" if i == self.cursor else " "
+            lines.append(f" {pointer} {row}")
+
+        lines.extend(self._footer)
+        return lines
 
     def handle_key(self, key: str) -> Action | View | None:
         if key in ("q", "\x03"):
@@ -765,6 +923,9 @@ class ResultView(View):
             session, _ = self.results[self.cursor]
             return OutputView(session)
 
+        else:  # Unbound key: nothing changed, skip the redraw
+            return Action("ignore")
+
         return None
 
 
@@ -815,23 +976,21 @@ class OutputView(View):
 
         lines.append("--- stdout ---")
         if self.session.stdout:
-            lines.extend(self.session.stdout.split("\n"))
+            lines.extend(self.session.stdout.splitlines())
         else:
             lines.append("(empty)")
         lines.append("")
         lines.append("--- stderr ---")
         if self.session.stderr:
-            lines.extend(self.session.stderr.split("\n"))
+            lines.extend(self.session.stderr.splitlines())
         else:
             lines.append("(empty)")
         return lines
 
-    def render(self) -> None:
-        clear_screen()
+    def render(self) -> list[str]:
         rows, cols = get_terminal_size()
 
-        print(f"\033[1m Output: {self.session.name} \033[0m")
-        print()
+        lines = [f"\033[1m Output: {self.session.name} \033[0m", ""]
 
         visible_rows = rows - 6
         if visible_rows < 3:
@@ -840,10 +999,11 @@ class OutputView(View):
 
         for line in visible_lines:
             display = line[: cols - 2]
-            print(f" {display}")
+            lines.append(f" {display}")
 
-        print()
-        print(" \033[90m[Up/Down] scroll  [Esc] back\033[0m")
+        lines.append("")
+        lines.append(" \033[90m[Up/Down] scroll  [Esc] back\033[0m")
+        return lines
 
     def handle_key(self, key: str) -> Action | None:
         rows, _ = get_terminal_size()
@@ -859,6 +1019,9 @@ class OutputView(View):
         elif key in ("k", "\x1b[A"):
             self.scroll = max(self.scroll - 1, 0)
 
+        else:  # Unbound key: nothing changed, skip the redraw
+            return Action("ignore")
+
         return None
 
 
@@ -869,15 +1032,6 @@ class OutputView(View):
 
 def execute_sessions(sessions: list[Session]) -> list[tuple[Session, int]]:
     """Execute sessions and return results."""
-    import time
-
-    from .audit import (
-        log_approval_decision,
-        log_execution_completed,
-        log_execution_started,
-    )
-    from .session import Session, execute_session
-
     # Audit log approval decision
     log_approval_decision(sessions, "approved", "tui")
 
@@ -890,11 +1044,10 @@ def execute_sessions(sessions: list[Session]) -> list[tuple[Session, int]]:
         log_execution_started(session)
         start_time = time.time()
 
+        # Updates stdout/stderr and results on this object and saves it,
+        # so there is no need to reload the session from disk
         exit_code = execute_session(session)
 
-        # Reload to get updated stdout/stderr
-        session = Session.load(session.id, audit=False)
-
         # Audit log execution complete
         duration = time.time() - start_time
         log_execution_completed(session, duration, session.error)
@@ -905,8 +1058,6 @@ def execute_sessions(sessions: list[Session]) -> list[tuple[Session, int]]:
 
 def reject_sessions(sessions: list[Session]) -> None:
     """Mark sessions as rejected."""
-    from .audit import log_approval_decision
-
     # Audit log rejection decision
     log_approval_decision(sessions, "rejected", "tui")
 
@@ -922,7 +1073,7 @@ def reject_sessions(sessions: list[Session]) -> None:
 
 def run_tui():
     """Main TUI event loop with unified action handling."""
-    from .session import Session
+    global _track_resize, _term_size
 
     # View stack for navigation
     view_stack: list[View] = [SessionListView()]
@@ -939,17 +1090,50 @@ def run_tui():
 
     def refresh_list():
         """Refresh the session list at bottom of stack."""
-        sessions = Session.list_pending()
-        view_stack[0] = SessionListView(sessions)
+        view_stack[0] = SessionListView()
 
-    hide_cursor()
+    def reset_to_list():
+        """Drop all views and show a freshly loaded session list."""
+        view_stack[:] = [SessionListView()]
+
+    fd = sys.stdin.fileno()
+    # Raises termios.error if stdin is not a terminal; nothing to restore yet
+    old_mode = enter_raw_mode(fd)
+    old_winch = signal.signal(signal.SIGWINCH, _on_resize)
+    _track_resize = True
+
+    # Last frame drawn; repeated frames of the same view only redraw changed lines
+    shown_view: View | None = None
+    shown_size = (0, 0)
+    shown_lines: list[str] = []
     try:
+        # Buffered, and flushed just before the first frame is written
+        hide_cursor()
+        disable_line_wrap()
+        redraw = True
         while True:
-            current_view().render()
-            sys.stdout.flush()
+            view = current_view()
+            size = get_terminal_size()
+            # Keys that arrived while the last frame was drawn (e.g. a held j/k)
+            # are all handled before drawing again, so the screen keeps up
+            if (redraw or size != shown_size) and not key_pending(fd):
+                lines = view.render()
+                if (
+                    view is shown_view
+                    and size == shown_size
+                    and max(len(lines), len(shown_lines)) < size[0]
+                ):
+                    write_frame(changed_lines_frame(shown_lines, lines))
+                else:
+                    # New view, resize, or a frame taller than the screen: full repaint
+                    write_frame(full_frame(lines))
+                shown_view, shown_size, shown_lines = view, size, lines
+                redraw = False
 
-            key = read_single_key()
+            key = read_single_key(fd)
             result = current_view().handle_key(key)
+            if not (isinstance(result, Action) and result.name == "ignore"):
+                redraw = True
 
             # Handle View returns (for nested views like OutputView)
             if isinstance(result, View):
@@ -985,7 +1169,18 @@ def run_tui():
                     print()
                     sys.stdout.flush()
 
-                    results = execute_sessions(result.sessions)
+                    # Sessions run with the terminal back in its normal mode, so
+                    # their output wraps and any prompts show a cursor
+                    exit_raw_mode(fd, old_mode)
+                    enable_line_wrap()
+                    show_cursor()
+                    sys.stdout.flush()
+                    try:
+                        results = execute_sessions(result.sessions)
+                    finally:
+                        enter_raw_mode(fd)
+                        hide_cursor()
+                        disable_line_wrap()
                     refresh_list()
                     push_view(ResultView(results))
 
@@ -994,14 +1189,18 @@ def run_tui():
 
                 elif result.name == "reject":
                     reject_sessions(result.sessions)
-                    refresh_list()
-                    # Go back to list
-                    while len(view_stack) > 1:
-                        view_stack.pop()
+                    reset_to_list()
 
     finally:
+        exit_raw_mode(fd, old_mode)
+        enable_line_wrap()
         show_cursor()
         clear_screen()
+        # Emit the restore sequences together now, before any traceback on stderr
+        sys.stdout.flush()
+        signal.signal(signal.SIGWINCH, old_winch)
+        _track_resize = False
+        _term_size = None
 
 
 # ==============================================================================
@@ -1025,8 +1224,6 @@ def main():
 
     args = parser.parse_args()
 
-    from .session import Session, execute_session
-
     # List mode
     if args.action == "list":
         sessions = Session.list_pending()
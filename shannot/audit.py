@@ -22,7 +22,7 @@ import getpass
 import json
 import os
 import socket
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
@@ -70,7 +70,25 @@ class AuditEvent:
 
     def to_json(self) -> str:
         """Serialize to compact JSON line (no trailing newline)."""
-        return json.dumps(asdict(self), separators=(",", ":"))
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable dict.
+
+        Built by hand rather than with dataclasses.asdict(), which deep-copies
+        the payload only for it to be serialized and discarded.
+        """
+        return {
+            "seq": self.seq,
+            "timestamp": self.timestamp,
+            "event_type": self.event_type,
+            "session_id": self.session_id,
+            "host": self.host,
+            "target": self.target,
+            "user": self.user,
+            "pid": self.pid,
+            "payload": self.payload,
+        }
 
 
 class AuditLogger:
@@ -268,6 +268,18 @@ def run_mcp_menu() -> int:
     return 0
 
 
+# 'shannot run' options forwarded unchanged to interact: (args attribute, option, takes value)
+_RUN_PASSTHROUGH = (
+    ("tmp", "--tmp", True),
+    ("nocolor", "--nocolor", False),
+    ("raw_stdout", "--raw-stdout", False),
+    ("debug", "--debug", False),
+    ("script_name", "--script-name", True),
+    ("analysis", "--analysis", True),
+    ("json_output", "--json-output", False),
+)
+
+
 def cmd_run(args: argparse.Namespace) -> int:
     """Handle 'shannot run' command."""
     # Validate: --session is mutually exclusive with script/-c
@@ -371,24 +383,15 @@ def cmd_run(args: argparse.Namespace) -> int:
             print("Run 'shannot status' to check current status.", file=sys.stderr)
             return 1
 
-    # Pass through other options
-    if args.tmp:
-        argv.append(f"--tmp={args.tmp}")
-    if args.nocolor:
-        argv.append("--nocolor")
-    if args.raw_stdout:
-        argv.append("--raw-stdout")
-    if args.debug:
-        argv.append("--debug")
     # run script.py is always dry-run (capture commands/writes for approval)
     # use --session to execute an approved session
     argv.append("--dry-run")
-    if args.script_name:
-        argv.append(f"--script-name={args.script_name}")
-    if args.analysis:
-        argv.append(f"--analysis={args.analysis}")
-    if args.json_output:
-        argv.append("--json-output")
+
+    # Pass through other options
+    for attr, option, takes_value in _RUN_PASSTHROUGH:
+        value = getattr(args, attr)
+        if value:
+            argv.append(f"{option}={value}" if takes_value else option)
 
     # Pass --code before executable (getopt stops at first positional)
     if args.code:
@@ -412,6 +415,8 @@ def cmd_run(args: argparse.Namespace) -> int:
 
 def cmd_run_remote(args: argparse.Namespace) -> int:
     """Handle 'shannot run --target' for remote execution."""
+    from pathlib import Path
+
     from .remote import RemoteExecutionError, run_remote_dry_run
 
     # Get script path from args.script (not script_args which are passed to script)
@@ -422,8 +427,7 @@ def cmd_run_remote(args: argparse.Namespace) -> int:
 
     # Read script content
     try:
-        with open(script_path) as f:
-            script_content = f.read()
+        script_content = Path(script_path).read_text(encoding="utf-8")
     except FileNotFoundError:
         print(f"Error: Script not found: {script_path}", file=sys.stderr)
         return 1
@@ -438,12 +442,14 @@ def cmd_run_remote(args: argparse.Namespace) -> int:
         )
 
         if session:
-            print(f"\n*** Remote session created: {session.id} ***")
-            print(f"    Target: {args.target}")
-            print(f"    Commands queued: {len(session.commands)}")
-            print(f"    File writes queued: {len(session.pending_writes)}")
-            print(f"    Deletions queued: {len(session.pending_deletions)}")
-            print("    Run 'shannot approve' to review and execute.")
+            print(
+                f"\n*** Remote session created: {session.id} ***\n"
+                f"    Target: {args.target}\n"
+                f"    Commands queued: {len(session.commands)}\n"
+                f"    File writes queued: {len(session.pending_writes)}\n"
+                f"    Deletions queued: {len(session.pending_deletions)}\n"
+                "    Run 'shannot approve' to review and execute."
+            )
             return 0
         else:
             print("\n*** No commands or writes were queued. ***")
@@ -476,7 +482,7 @@ def cmd_run_session(args: argparse.Namespace) -> int:
         session = Session.load(session_id)
     except FileNotFoundError:
         if args.json_output:
-            print(json.dumps({"error": f"Session not found: {session_id}"}))
+            print(json.dumps({"error": f"Session not found: {session_id}"}, separators=(",", ":")))
         else:
             print(f"Error: Session not found: {session_id}", file=sys.stderr)
         return 1
@@ -485,11 +491,9 @@ def cmd_run_session(args: argparse.Namespace) -> int:
     session.status = "approved"
     session.save()
 
+    # Sets status, output and completed writes on session and saves it
     exit_code = execute_session(session)
 
-    # Reload to get updated fields
-    session = Session.load(session_id)
-
     if args.json_output:
         output = {
             "version": get_version(),
@@ -499,7 +503,7 @@ def cmd_run_session(args: argparse.Namespace) -> int:
             "stderr": session.stderr or "",
             "completed_writes": session.completed_writes or [],
         }
-        print(json.dumps(output))
+        print(json.dumps(output, separators=(",", ":")))
     else:
         if exit_code == 0:
             print(f"Session {session.id} executed successfully")
@@ -548,18 +552,16 @@ def cmd_remote_list(args: argparse.Namespace) -> int:
         print("Use 'shannot setup remote add <name> <host>' to add one.")
         return 0
 
-    # Calculate column widths
-    name_width = max(len(name) for name in remotes.keys())
-    name_width = max(name_width, 4)  # Minimum "NAME" header width
+    items = sorted(remotes.items())
+    name_width = max(4, *(len(name) for name, _ in items))  # Minimum "NAME" header width
 
-    print(f"{'NAME':<{name_width}}  TARGET")
-    print(f"{'-' * name_width}  {'-' * 30}")
-
-    for name, remote in sorted(remotes.items()):
+    lines = [f"{'NAME':<{name_width}}  TARGET", f"{'-' * name_width}  {'-' * 30}"]
+    for name, remote in items:
         target = f"{remote.user}@{remote.host}"
         if remote.port != 22:
             target += f":{remote.port}"
-        print(f"{name:<{name_width}}  {target}")
+        lines.append(f"{name:<{name_width}}  {target}")
+    print("\n".join(lines))
 
     return 0
 
@@ -1038,33 +1040,8 @@ class _VersionAction(argparse.Action):
         parser.exit()
 
 
-def main() -> int:
-    import textwrap
-
-    parser = argparse.ArgumentParser(
-        prog="shannot",
-        description="Run Python in a sandbox. Commands execute only after your approval.",
-        epilog=textwrap.dedent("""\
-            Quick start:
-              shannot run script.py                Run script, queue commands for review
-              shannot run --code "print('hi')"     Run inline code
-              shannot approve                      Review and execute queued commands
-
-            See 'shannot <command> --help' for more details.
-        """),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    parser.add_argument(
-        "--version",
-        action=_VersionAction,
-    )
-    subparsers = parser.add_subparsers(
-        dest="command",
-        help="Commands",
-        metavar="{run,approve,status,setup,rollback,checkpoint}",
-    )
-
-    # ===== setup subcommand (with sub-subcommands) =====
+def _add_setup_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the setup subcommand (with sub-subcommands)."""
     setup_parser = subparsers.add_parser(
         "setup",
         help="Configure shannot (interactive menu or subcommands)",
@@ -1199,7 +1176,9 @@ def main() -> int:
 
     setup_parser.set_defaults(func=cmd_setup)
 
-    # ===== run subcommand =====
+
+def _add_run_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the run subcommand."""
     run_parser = subparsers.add_parser(
         "run",
         help="Run a script in the sandbox",
@@ -1274,7 +1253,9 @@ def main() -> int:
     )
     run_parser.set_defaults(func=cmd_run)
 
-    # ===== approve subcommand (delegates to existing approve module) =====
+
+def _add_approve_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the approve subcommand (delegates to existing approve module)."""
     approve_parser = subparsers.add_parser(
         "approve",
         help="Interactive session approval",
@@ -1287,7 +1268,9 @@ def main() -> int:
     )
     approve_parser.set_defaults(func=cmd_approve)
 
-    # ===== status subcommand =====
+
+def _add_status_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the status subcommand."""
     status_parser = subparsers.add_parser(
         "status",
         help="Show system status",
@@ -1305,7 +1288,9 @@ def main() -> int:
     )
     status_parser.set_defaults(func=cmd_status)
 
-    # ===== rollback subcommand =====
+
+def _add_rollback_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the rollback subcommand."""
     rollback_parser = subparsers.add_parser(
         "rollback",
         help="Rollback session to pre-execution state",
@@ -1329,7 +1314,9 @@ def main() -> int:
     )
     rollback_parser.set_defaults(func=cmd_rollback)
 
-    # ===== checkpoint subcommand =====
+
+def _add_checkpoint_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the checkpoint subcommand."""
     checkpoint_parser = subparsers.add_parser(
         "checkpoint",
         help="Manage checkpoints",
@@ -1359,8 +1346,91 @@ def main() -> int:
     )
     checkpoint_parser.set_defaults(func=cmd_checkpoint)
 
+
+# Subcommand parser builders, keyed by command name
+_COMMAND_PARSERS = {
+    "setup": _add_setup_parser,
+    "run": _add_run_parser,
+    "approve": _add_approve_parser,
+    "status": _add_status_parser,
+    "rollback": _add_rollback_parser,
+    "checkpoint": _add_checkpoint_parser,
+}
+
+
+def _sniff_command(argv: list[str]) -> str | None:
+    """
+    Return the subcommand named on the command line without parsing it.
+
+    None if no command is given or top-level help is requested first.
+    """
+    for arg in argv:
+        if arg in ("-h", "--help"):
+            return None
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+# Parsers already built by main(), keyed by sniffed command (None for all commands)
+_PARSERS: dict[str | None, argparse.ArgumentParser] = {}
+
+
+def _build_parser(command: str | None) -> argparse.ArgumentParser:
+    """Build the top-level parser with just ``command``'s subparser, or all if None."""
+    import textwrap
+
+    parser = argparse.ArgumentParser(
+        prog="shannot",
+        description="Run Python in a sandbox. Commands execute only after your approval.",
+        epilog=textwrap.dedent("""\
+            Quick start:
+              shannot run script.py                Run script, queue commands for review
+              shannot run --code "print('hi')"     Run inline code
+              shannot approve                      Review and execute queued commands
+
+            See 'shannot <command> --help' for more details.
+        """),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--version",
+        action=_VersionAction,
+    )
+    subparsers = parser.add_subparsers(
+        dest="command",
+        help="Commands",
+        metavar="{run,approve,status,setup,rollback,checkpoint}",
+    )
+
+    if command is not None:
+        # Only the invoked command's arguments matter for parsing this command line
+        _COMMAND_PARSERS[command](subparsers)
+    else:
+        for add_parser in _COMMAND_PARSERS.values():
+            add_parser(subparsers)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the shannot command line (``sys.argv[1:]`` unless ``argv`` is given).
+
+    May be called repeatedly in one process; parsers are built once and reused.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    command = _sniff_command(argv)
+    if command not in _COMMAND_PARSERS:
+        # No command, top-level help, or an unknown name: build all for help/errors
+        command = None
+    parser = _PARSERS.get(command)
+    if parser is None:
+        parser = _PARSERS[command] = _build_parser(command)
+
     # Parse and execute
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command is None:
         parser.print_help()
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import getpass
 import os
+import sys
 import tomllib
 from dataclasses import dataclass, field
 from enum import Enum
@@ -30,12 +31,18 @@ def get_version() -> str:
     global _version_cache
     if _version_cache is None:
         try:
-            from importlib.metadata import version
-
-            _version_cache = version("shannot")
-        except Exception:
-            # Fallback for development/edge cases
-            _version_cache = "dev"
+            # Frozen at build time for compiled binaries (see build_binary.py)
+            from ._version import __version__
+
+            _version_cache = __version__
+        except ImportError:
+            try:
+                from importlib.metadata import version
+
+                _version_cache = version("shannot")
+            except Exception:
+                # Fallback for development/edge cases
+                _version_cache = "dev"
     return _version_cache
 
 
@@ -52,12 +59,12 @@ def get_remote_deploy_dir() -> str:
 
 def _xdg_data_home() -> Path:
     """XDG data directory (~/.local/share or $XDG_DATA_HOME)."""
-    return Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local/share"))
+    return Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local/share")
 
 
 def _xdg_config_home() -> Path:
     """XDG config directory (~/.config or $XDG_CONFIG_HOME)."""
-    return Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
+    return Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
 
 
 # Data directories
@@ -91,10 +98,7 @@ PYPY_CONFIG: dict[str, dict[str, str]] = {
 
 def get_pypy_config() -> dict[str, str]:
     """Get PyPy stdlib config for current platform."""
-    import platform
-
-    system = platform.system().lower()
-    return PYPY_CONFIG.get(system, PYPY_CONFIG["linux"])
+    return PYPY_CONFIG.get(sys.platform, PYPY_CONFIG["linux"])
 
 
 # Platform-specific sandbox binary configuration
@@ -124,9 +128,7 @@ SANDBOX_CONFIG: dict[str, dict[str, str]] = {
 
 def get_sandbox_lib_name() -> str:
     """Get platform-specific shared library name."""
-    import platform
-
-    if platform.system() == "Darwin":
+    if sys.platform == "darwin":
         return "libpypy3-c.dylib"
     return "libpypy3-c.so"
 
@@ -565,6 +567,22 @@ class Config:
 # ============================================================================
 
 
+# Parsed TOML per config file path, reused while the file's mtime and size are unchanged
+_toml_cache: dict[Path, tuple[int, int, dict]] = {}
+
+
+def _read_toml(path: Path) -> dict:
+    """Parse a TOML file, or return the previous parse if the file has not changed."""
+    st = path.stat()
+    cached = _toml_cache.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    _toml_cache[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
 def find_project_root() -> Path | None:
     """Walk up from cwd to find .shannot directory."""
     current = Path.cwd()
@@ -620,14 +638,13 @@ def load_config() -> Config:
 
     if config_path:
         try:
-            with open(config_path, "rb") as f:
-                data = tomllib.load(f)
+            data = _read_toml(config_path)
 
-            # Parse profile section
+            # Parse profile section; copy lists and dicts, data may be a cached parse
             profile_data = data.get("profile", {})
             profile = ProfileConfig(
-                auto_approve=profile_data.get("auto_approve", DEFAULT_AUTO_APPROVE.copy()),
-                always_deny=profile_data.get("always_deny", DEFAULT_ALWAYS_DENY.copy()),
+                auto_approve=list(profile_data.get("auto_approve", DEFAULT_AUTO_APPROVE)),
+                always_deny=list(profile_data.get("always_deny", DEFAULT_ALWAYS_DENY)),
             )
 
             # Parse audit section
@@ -636,7 +653,7 @@ def load_config() -> Config:
                 enabled=audit_data.get("enabled", True),
                 rotation=audit_data.get("rotation", "daily"),
                 max_files=audit_data.get("max_files", 30),
-                events=audit_data.get("events", _default_audit_events()),
+                events=dict(audit_data.get("events", _default_audit_events())),
             )
         except (OSError, tomllib.TOMLDecodeError):
             pass  # Use defaults
@@ -646,8 +663,7 @@ def load_config() -> Config:
     global_config = CONFIG_DIR / CONFIG_FILENAME
     if global_config.exists():
         try:
-            with open(global_config, "rb") as f:
-                global_data = tomllib.load(f)
+            global_data = _read_toml(global_config)
             for name, remote_data in global_data.get("remotes", {}).items():
                 remotes[name] = Remote(
                     host=remote_data.get("host", ""),
@@ -703,6 +719,8 @@ def save_config(config: Config) -> None:
         lines.append("")
 
     config_path.write_text("\n".join(lines))
+    # Don't rely on the mtime changing for a rewrite within the same timestamp tick
+    _toml_cache.pop(config_path, None)
 
 
 def _toml_array(key: str, values: list[str]) -> str:
@@ -48,7 +48,7 @@ def detect_arch(ssh: SSHConnection) -> str:
     if result.returncode != 0:
         raise RuntimeError("Failed to detect remote architecture")
 
-    arch = result.stdout.decode().strip()
+    arch = result.stdout.decode("utf-8", errors="replace").strip()
     # Normalize architecture names
     if arch in ("x86_64", "amd64"):
         return "x86_64"
@@ -306,17 +306,19 @@ def _get_stdlib_archive() -> Path:
 # =============================================================================
 
 
-def is_cli_deployed(ssh: SSHConnection) -> bool:
-    """Check if shannot CLI is deployed on remote."""
-    deploy_dir = get_remote_deploy_dir()
-    result = ssh.run(f"test -x {deploy_dir}/shannot")
-    return result.returncode == 0
+def _cli_check(deploy_dir: str) -> str:
+    """Remote shell test that succeeds if the CLI binary is deployed."""
+    return f"test -x {deploy_dir}/shannot"
+
+
+def _runtime_check(deploy_dir: str) -> str:
+    """Remote shell test that succeeds if the PyPy runtime is deployed."""
+    return f"test -x {deploy_dir}/pypy3-c && test -d {deploy_dir}/lib-python"
 
 
 def is_runtime_deployed(ssh: SSHConnection) -> bool:
     """Check if PyPy runtime (sandbox + stdlib) is deployed on remote."""
-    deploy_dir = get_remote_deploy_dir()
-    result = ssh.run(f"test -x {deploy_dir}/pypy3-c && test -d {deploy_dir}/lib-python")
+    result = ssh.run(_runtime_check(get_remote_deploy_dir()))
     return result.returncode == 0
 
 
@@ -325,7 +327,7 @@ def get_deployed_version(ssh: SSHConnection) -> str | None:
     deploy_dir = get_remote_deploy_dir()
     result = ssh.run(f"{deploy_dir}/shannot --version 2>/dev/null || echo ''")
     if result.returncode == 0:
-        output = result.stdout.decode().strip()
+        output = result.stdout.decode("utf-8", errors="replace").strip()
         if output:
             # Output format is "shannot X.Y.Z" - extract version number
             parts = output.split()
@@ -345,13 +347,14 @@ def deploy_cli(ssh: SSHConnection, force: bool = False) -> bool:
     deploy_dir = get_remote_deploy_dir()
     version = get_version()
 
-    if not force and is_cli_deployed(ssh):
-        # Check version
+    if not force:
+        # A missing binary reports no version, so this doubles as the existence check
         deployed_ver = get_deployed_version(ssh)
         if deployed_ver == version:
             sys.stderr.write(f"[DEPLOY] CLI v{version} already deployed\n")
             return True
-        sys.stderr.write(f"[DEPLOY] Upgrading CLI: {deployed_ver} → {version}\n")
+        if deployed_ver is not None:
+            sys.stderr.write(f"[DEPLOY] Upgrading CLI: {deployed_ver} → {version}\n")
 
     try:
         arch = detect_arch(ssh)
@@ -497,8 +500,10 @@ def deploy(ssh: SSHConnection, force: bool = False) -> bool:
 
 
 def is_deployed(ssh: SSHConnection) -> bool:
-    """Check if both CLI and runtime are deployed on remote."""
-    return is_cli_deployed(ssh) and is_runtime_deployed(ssh)
+    """Check if both CLI and runtime are deployed on remote (single round trip)."""
+    deploy_dir = get_remote_deploy_dir()
+    result = ssh.run(f"{_cli_check(deploy_dir)} && {_runtime_check(deploy_dir)}")
+    return result.returncode == 0
 
 
 def ensure_deployed(ssh: SSHConnection) -> bool:
@@ -4,20 +4,160 @@ Sandbox process controller.
 Internal module - use 'shannot run' CLI instead.
 """
 
-import subprocess
+from __future__ import annotations
+
 import sys
 
-from shannot import VirtualizedProc
-from shannot.mix_accept_input import MixAcceptInput
-from shannot.mix_dump_output import MixDumpOutput
-from shannot.mix_pypy import MixPyPy
-from shannot.mix_remote import MixRemote
-from shannot.mix_subprocess import MixSubprocess
-from shannot.mix_vfs import Dir, MixVFS, RealDir
-from shannot.vfs_procfs import build_proc, build_sys
+# Not imported from typing: the usage path is meant to import nothing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+
+# The sandboxed interpreter starts with an empty environment; the dump variant
+# makes it print its syscall signature table and exit (used by --debug)
+_SANDBOX_ENV: dict[str, str] = {}
+_SANDBOX_DUMP_ENV = {"RPY_SANDBOX_DUMP": "1"}
+
+
+def _read_file(path: str) -> bytes:
+    """Read a whole file with raw syscalls, skipping the buffered file object."""
+    import os
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Ask for one byte past the size so a single read normally hits EOF
+        bufsize = os.fstat(fd).st_size + 1
+        chunks = []
+        while chunk := os.read(fd, bufsize):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+class _RunOptions:
+    """Command-line state collected by the option handlers below."""
+
+    # Plain class rather than a dataclass: importing dataclasses would put
+    # inspect on the usage path, which is meant to import nothing
+
+    def __init__(self, proc: Any, arguments: list[str], sandbox_args: dict[str, Any]):
+        self.proc = proc  # SandboxedProc class built in main()
+        self.arguments = arguments
+        self.sandbox_args = sandbox_args
+        self.color = True
+        self.raw_stdout = False
+        self.json_output = False
+        self.approved_commands: list[str] = []
+        self.inline_code: str | None = None  # For -c flag
+        self.lib_path_specified = False
+        self.session_id: str | None = None
+
+
+def _opt_tmp(opts: _RunOptions, value: str) -> None:
+    from shannot.mix_vfs import RealDir
+
+    opts.proc.vfs_root.entries["tmp"] = RealDir(value)
+    opts.sandbox_args["tmp"] = value
+
+
+def _opt_lib_path(opts: _RunOptions, value: str) -> None:
+    from shannot.mix_vfs import MixVFS
+
+    opts.lib_path_specified = True
+    opts.proc.vfs_root.entries["lib"] = MixVFS.vfs_pypy_lib_directory(value)
+    opts.arguments[0] = "/lib/pypy"
+    opts.sandbox_args["lib_path"] = value
+
+
+def _opt_nocolor(opts: _RunOptions, value: str) -> None:
+    opts.color = False
+    opts.sandbox_args["nocolor"] = True
+
+
+def _opt_raw_stdout(opts: _RunOptions, value: str) -> None:
+    opts.raw_stdout = True
+    opts.sandbox_args["raw_stdout"] = True
+
+
+def _opt_debug(opts: _RunOptions, value: str) -> None:
+    opts.proc.debug_errors = True
+
+
+def _opt_dry_run(opts: _RunOptions, value: str) -> None:
+    opts.proc.subprocess_dry_run = True
+    opts.proc.vfs_track_writes = True  # Track file writes for approval
+    opts.proc.vfs_track_deletions = True  # Track file deletions for approval
+
+
+def _opt_session_id(opts: _RunOptions, value: str) -> None:
+    opts.session_id = value
+    # Enable tracking for session execution (writes/deletions committed after)
+    opts.proc.vfs_track_writes = True
+    opts.proc.vfs_track_deletions = True
+
+
+def _opt_script_name(opts: _RunOptions, value: str) -> None:
+    opts.proc.subprocess_script_name = value
+    opts.sandbox_args["script_name"] = value
+
+
+def _opt_analysis(opts: _RunOptions, value: str) -> None:
+    opts.proc.subprocess_analysis = value
+    opts.sandbox_args["analysis"] = value
+
+
+def _opt_target(opts: _RunOptions, value: str) -> None:
+    opts.proc.remote_target = value
+    opts.sandbox_args["target"] = value
+
+
+def _opt_json_output(opts: _RunOptions, value: str) -> None:
+    opts.json_output = True
+
+
+def _opt_approved_commands(opts: _RunOptions, value: str) -> None:
+    import json
+
+    opts.approved_commands = json.loads(value)
+
+
+def _opt_code(opts: _RunOptions, value: str) -> None:
+    opts.inline_code = value
+
+
+_OPTION_HANDLERS = {
+    "--tmp": _opt_tmp,
+    "--lib-path": _opt_lib_path,
+    "--nocolor": _opt_nocolor,
+    "--raw-stdout": _opt_raw_stdout,
+    "--debug": _opt_debug,
+    "--dry-run": _opt_dry_run,
+    "--session-id": _opt_session_id,
+    "--script-name": _opt_script_name,
+    "--analysis": _opt_analysis,
+    "--target": _opt_target,
+    "--json-output": _opt_json_output,
+    "--approved-commands": _opt_approved_commands,
+    "--code": _opt_code,
+}
+
+
+def _usage() -> int:
+    sys.stderr.write(
+        "Usage: shannot run [options] <script.py> [args...]\n"
+        "See 'shannot run --help' for details.\n"
+    )
+    return 2
 
 
 def main(argv):
+    # Cheap argv sniff so bare/help invocations return before importing
+    # anything (getopt alone pulls in gettext)
+    if not argv or argv[0] in ("-h", "--help"):
+        return _usage()
+
     from getopt import getopt  # and not gnu_getopt!
 
     options, arguments = getopt(
@@ -41,15 +181,20 @@ def main(argv):
         ],
     )
 
-    def help():
-        sys.stderr.write(
-            "Usage: shannot run [options] <script.py> [args...]\n"
-            "See 'shannot run --help' for details.\n"
-        )
-        return 2
+    if len(arguments) < 1 or any(option in ("-h", "--help") for option, _ in options):
+        return _usage()
+
+    # Deferred so the usage path above doesn't pay for the sandbox machinery
+    import subprocess
 
-    if len(arguments) < 1:
-        return help()
+    from shannot import VirtualizedProc
+    from shannot.mix_accept_input import MixAcceptInput
+    from shannot.mix_dump_output import MixDumpOutput
+    from shannot.mix_pypy import MixPyPy
+    from shannot.mix_remote import MixRemote
+    from shannot.mix_subprocess import MixSubprocess
+    from shannot.mix_vfs import Dir, MixVFS, RealDir
+    from shannot.vfs_procfs import build_proc, build_sys
 
     class SandboxedProc(
         MixRemote, MixSubprocess, MixPyPy, MixVFS, MixDumpOutput, MixAcceptInput, VirtualizedProc
@@ -57,11 +202,6 @@ def main(argv):
         virtual_cwd = "/tmp"
         vfs_root = Dir({"tmp": Dir({})})
 
-    color = True
-    raw_stdout = False
-    json_output = False
-    approved_commands = []
-    inline_code = None  # For -c flag
     executable = arguments[0]
 
     # Capture sandbox args as structured dict for session re-execution
@@ -76,56 +216,14 @@ def main(argv):
         "target": None,
     }
 
-    lib_path_specified = False
-    session_id = None
-
+    opts = _RunOptions(proc=SandboxedProc, arguments=arguments, sandbox_args=sandbox_args)
     for option, value in options:
-        if option == "--tmp":
-            SandboxedProc.vfs_root.entries["tmp"] = RealDir(value)
-            sandbox_args["tmp"] = value
-        elif option == "--lib-path":
-            lib_path_specified = True
-            SandboxedProc.vfs_root.entries["lib"] = MixVFS.vfs_pypy_lib_directory(value)
-            arguments[0] = "/lib/pypy"
-            sandbox_args["lib_path"] = value
-        elif option == "--nocolor":
-            color = False
-            sandbox_args["nocolor"] = True
-        elif option == "--raw-stdout":
-            raw_stdout = True
-            sandbox_args["raw_stdout"] = True
-        elif option == "--debug":
-            SandboxedProc.debug_errors = True
-        elif option == "--dry-run":
-            SandboxedProc.subprocess_dry_run = True
-            SandboxedProc.vfs_track_writes = True  # Track file writes for approval
-            SandboxedProc.vfs_track_deletions = True  # Track file deletions for approval
-        elif option == "--session-id":
-            session_id = value
-            # Enable tracking for session execution (writes/deletions committed after)
-            SandboxedProc.vfs_track_writes = True
-            SandboxedProc.vfs_track_deletions = True
-        elif option == "--script-name":
-            SandboxedProc.subprocess_script_name = value  # type: ignore[misc]
-            sandbox_args["script_name"] = value
-        elif option == "--analysis":
-            SandboxedProc.subprocess_analysis = value  # type: ignore[misc]
-            sandbox_args["analysis"] = value
-        elif option == "--target":
-            SandboxedProc.remote_target = value
-            sandbox_args["target"] = value
-        elif option == "--json-output":
-            json_output = True
-        elif option == "--approved-commands":
-            import json as json_module
-
-            approved_commands = json_module.loads(value)
-        elif option == "--code":
-            inline_code = value
-        elif option in ["-h", "--help"]:
-            return help()
-        else:
+        handler = _OPTION_HANDLERS.get(option)
+        if handler is None:
             raise ValueError(option)
+        handler(opts, value)
+
+    session_id = opts.session_id
 
     # Validate executable argument (basic checks)
     import os
@@ -146,19 +244,20 @@ def main(argv):
     script_content: bytes | None = None
     script_arg_idx: int | None = None
 
-    if inline_code is not None:
+    if opts.inline_code is not None:
         # -c flag: use inline code directly
-        script_content = inline_code.encode("utf-8")
+        script_content = opts.inline_code.encode("utf-8")
         # Add virtual script path to arguments
         arguments.append("/script.py")
     else:
         # Find script file in arguments and read it
         for i, arg in enumerate(arguments[1:], 1):
             if arg.endswith(".py") and not arg.startswith("-"):
-                if os.path.exists(arg):
-                    with open(arg, "rb") as f:
-                        script_content = f.read()
+                try:
+                    script_content = _read_file(arg)
                     script_arg_idx = i
+                except FileNotFoundError:
+                    pass
                 break
 
         # Replace script path with virtual path
@@ -172,7 +271,7 @@ def main(argv):
         script_content = bootstrap + script_content
 
     # Auto-detect runtime if --lib-path not specified
-    if not lib_path_specified:
+    if not opts.lib_path_specified:
         from shannot.runtime import get_runtime_path
 
         runtime_path = get_runtime_path()
@@ -206,10 +305,10 @@ def main(argv):
             sys.stderr.write(msg)
             return 1
 
-    if color:
+    if opts.color:
         SandboxedProc.dump_stdout_fmt = SandboxedProc.dump_get_ansi_color_fmt(32)
         SandboxedProc.dump_stderr_fmt = SandboxedProc.dump_get_ansi_color_fmt(31)
-    if raw_stdout:
+    if opts.raw_stdout:
         SandboxedProc.raw_stdout = True
 
     # Add virtual /proc and /sys filesystems
@@ -237,24 +336,23 @@ def main(argv):
         popen1 = subprocess.Popen(
             arguments[:1],
             executable=executable,
-            env={"RPY_SANDBOX_DUMP": "1"},
+            env=_SANDBOX_DUMP_ENV,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
         )
-        vp = SandboxedProc(popen1.stdin, popen1.stdout)
-        assert popen1.stdout is not None
-        errors = vp.check_dump(popen1.stdout.read())
+        # check_dump is a classmethod; the dump is a small signature table,
+        # so a single communicate() reads it and reaps the child
+        dump, _ = popen1.communicate()
+        errors = SandboxedProc.check_dump(dump)
         if errors:
             for error in errors:
                 sys.stderr.write("*** " + error + "\n")
-        popen1.wait()
-        if errors:
             return 1
 
     popen = subprocess.Popen(
         arguments,
         executable=executable,
-        env={},
+        env=_SANDBOX_ENV,
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
     )
@@ -278,8 +376,8 @@ def main(argv):
     virtualizedproc.load_profile()
 
     # Add pre-approved commands (for recovery when remote session was cleaned up)
-    if approved_commands:
-        virtualizedproc.subprocess_approved.update(approved_commands)
+    if opts.approved_commands:
+        virtualizedproc.subprocess_approved.update(opts.approved_commands)
 
     # Load session commands if re-executing an approved session
     # (must be after profile so session commands take precedence)
@@ -298,7 +396,7 @@ def main(argv):
     if SandboxedProc.subprocess_dry_run:
         session = virtualizedproc.finalize_session()
 
-        if json_output:
+        if opts.json_output:
             # JSON output for remote protocol
             import json as json_module
 
@@ -316,7 +414,7 @@ def main(argv):
                 if session
                 else None,
             }
-            print(json_module.dumps(output))
+            print(json_module.dumps(output, separators=(",", ":")))
         elif session:
             print(f"\n*** Session created: {session.id} ***")
             print(f"    Commands queued: {len(session.commands)}")
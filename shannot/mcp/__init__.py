@@ -13,8 +13,29 @@ Key components:
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .protocol import serve
+    from .server import MCPServer
+    from .server_impl import ShannotMCPServer
+
 __all__ = ["MCPServer", "ShannotMCPServer", "serve"]
 
-from .protocol import serve
-from .server import MCPServer
-from .server_impl import ShannotMCPServer
+# Public name -> submodule defining it, imported on first attribute access so
+# that e.g. ``shannot.mcp.protocol`` can be used without loading server_impl
+_LAZY_ATTRS = {
+    "serve": ".protocol",
+    "MCPServer": ".server",
+    "ShannotMCPServer": ".server_impl",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -49,12 +49,17 @@ def write_message(msg: dict[str, Any]) -> None:
     Notes
     -----
     Writes one line of JSON followed by newline, then flushes stdout
-    to ensure immediate delivery.
+    to ensure immediate delivery. Uses json.dumps rather than json.dump:
+    only the one-shot path uses the C encoder, and it yields one write
+    instead of one per encoded chunk. The newline is written separately
+    so large tool output is not copied just to append it; both writes
+    land in the stream buffer ahead of the single flush.
     """
     try:
-        json.dump(msg, sys.stdout)
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+        out = sys.stdout
+        out.write(json.dumps(msg, separators=(",", ":")))
+        out.write("\n")
+        out.flush()
     except (OSError, BrokenPipeError):
         # Client disconnected - exit gracefully
         sys.exit(0)
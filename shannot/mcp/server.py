@@ -41,6 +41,8 @@ class MCPServer:
         Registered resource definitions.
     resource_handlers : dict[str, Callable]
         Resource read handlers.
+    method_handlers : dict[str, Callable]
+        JSON-RPC method name to handler, called with the request params.
     """
 
     def __init__(self, name: str, version: str):
@@ -64,6 +66,20 @@ class MCPServer:
         self.resources: dict[str, Resource] = {}
         self.resource_handlers: dict[str, Callable[[], str]] = {}
 
+        # Serialized tools/list and resources/list payloads, rebuilt on registration
+        self._tools_payload: list[dict[str, Any]] | None = None
+        self._resources_payload: list[dict[str, Any]] | None = None
+
+        # JSON-RPC method dispatch (one dict lookup per request)
+        self.method_handlers: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+            "initialize": self._handle_initialize,
+            "ping": lambda params: {},
+            "tools/list": lambda params: self._handle_list_tools(),
+            "tools/call": self._handle_call_tool,
+            "resources/list": lambda params: self._handle_list_resources(),
+            "resources/read": self._handle_read_resource,
+        }
+
         # Register tools and resources
         self._register_tools()
         self._register_resources()
@@ -99,6 +115,7 @@ class MCPServer:
         tool = Tool(name=name, description=description, inputSchema=input_schema)
         self.tools[name] = tool
         self.tool_handlers[name] = handler
+        self._tools_payload = None
 
     def register_resource(
         self,
@@ -131,6 +148,7 @@ class MCPServer:
         )
         self.resources[uri] = resource
         self.resource_handlers[uri] = handler
+        self._resources_payload = None
 
     def handle_request(self, request: dict[str, Any]) -> dict[str, Any] | None:
         """Handle incoming JSON-RPC request.
@@ -147,26 +165,20 @@ class MCPServer:
         """
         method = request.get("method")
         request_id = request.get("id")
-        params = request.get("params", {})
 
-        logger.debug(f"Received request: method={method}, id={request_id}")
+        # Lazy %-formatting: this runs per message and debug logging is usually off
+        logger.debug("Received request: method=%s, id=%s", method, request_id)
+
+        handler = self.method_handlers.get(method)  # type: ignore[arg-type]
+        if handler is None and request_id is None:
+            # Unhandled notification (e.g. notifications/initialized): nothing to reply
+            return None
 
         # Dispatch to appropriate handler
         try:
-            if method == "initialize":
-                result = self._handle_initialize(params)
-            elif method == "ping":
-                result = {}
-            elif method == "tools/list":
-                result = self._handle_list_tools()
-            elif method == "tools/call":
-                result = self._handle_call_tool(params)
-            elif method == "resources/list":
-                result = self._handle_list_resources()
-            elif method == "resources/read":
-                result = self._handle_read_resource(params)
-            else:
+            if handler is None:
                 raise ValueError(f"Unknown method: {method}")
+            result = handler(request.get("params", {}))
 
             # Return response for requests (have id)
             if request_id is not None:
@@ -223,7 +235,9 @@ class MCPServer:
 
     def _handle_list_tools(self) -> dict[str, Any]:
         """Handle tools/list request."""
-        return {"tools": [tool.to_dict() for tool in self.tools.values()]}
+        if self._tools_payload is None:
+            self._tools_payload = [tool.to_dict() for tool in self.tools.values()]
+        return {"tools": self._tools_payload}
 
     def _handle_call_tool(self, params: dict[str, Any]) -> dict[str, Any]:
         """Handle tools/call request."""
@@ -240,7 +254,9 @@ class MCPServer:
 
     def _handle_list_resources(self) -> dict[str, Any]:
         """Handle resources/list request."""
-        return {"resources": [res.to_dict() for res in self.resources.values()]}
+        if self._resources_payload is None:
+            self._resources_payload = [res.to_dict() for res in self.resources.values()]
+        return {"resources": self._resources_payload}
 
     def _handle_read_resource(self, params: dict[str, Any]) -> dict[str, Any]:
         """Handle resources/read request."""
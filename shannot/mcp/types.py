@@ -14,7 +14,7 @@ from typing import Any, Literal
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TextContent:
     """Text content in MCP responses."""
 
@@ -31,7 +31,7 @@ class TextContent:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Tool:
     """MCP tool definition."""
 
@@ -53,7 +53,7 @@ class Tool:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Resource:
     """MCP resource definition."""
 
@@ -80,7 +80,7 @@ class Resource:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptArgument:
     """Argument definition for a prompt."""
 
@@ -96,7 +96,7 @@ class PromptArgument:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptMessage:
     """Message in a prompt template."""
 
@@ -111,7 +111,7 @@ class PromptMessage:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Prompt:
     """MCP prompt template definition."""
 
@@ -129,7 +129,7 @@ class Prompt:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class GetPromptResult:
     """Result of get_prompt request."""
 
@@ -151,7 +151,7 @@ class GetPromptResult:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolsCapability:
     """Server capability for tools."""
 
@@ -162,7 +162,7 @@ class ToolsCapability:
         return {"listChanged": self.listChanged}
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourcesCapability:
     """Server capability for resources."""
 
@@ -174,7 +174,7 @@ class ResourcesCapability:
         return {"subscribe": self.subscribe, "listChanged": self.listChanged}
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptsCapability:
     """Server capability for prompts."""
 
@@ -185,7 +185,7 @@ class PromptsCapability:
         return {"listChanged": self.listChanged}
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerCapabilities:
     """Server capabilities declaration."""
 
@@ -210,7 +210,7 @@ class ServerCapabilities:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerInfo:
     """Server information for initialization."""
 
@@ -226,7 +226,7 @@ class ServerInfo:
 PROTOCOL_VERSION = "2024-11-05"
 
 
-@dataclass
+@dataclass(slots=True)
 class InitializationOptions:
     """Server initialization options."""
 
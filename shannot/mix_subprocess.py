@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import subprocess as real_subprocess
 import sys
+import time
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from .queue import write_pending
 from .virtualizedproc import signature
 
 if TYPE_CHECKING:
@@ -14,14 +15,35 @@ if TYPE_CHECKING:
     from .ssh import SSHConnection
 
 
+# Scripts tend to run the same few command strings over and over; the
+# permission sets can change mid-session, so only the parse is cached
+@lru_cache(maxsize=1024)
+def _base_command(cmd: str) -> str:
+    """Extract base command from shell string."""
+    # Handle pipes, redirects, etc.
+    parts = cmd.split()
+    if not parts:
+        return ""
+
+    # Skip env vars like FOO=bar cmd
+    base = parts[0]
+    for p in parts:
+        if "=" not in p:
+            base = p
+            break
+
+    # Strip path
+    return base.rpartition("/")[2]
+
+
 class MixSubprocess:
     """
     Mixin to handle system() calls from the sandbox.
 
     Security tiers (checked in order):
-        1. subprocess_always_deny: set - never execute
+        1. subprocess_always_deny: frozenset - never execute
         2. subprocess_approved: set - session-approved commands
-        3. subprocess_auto_approve: set - execute immediately (from profile)
+        3. subprocess_auto_approve: frozenset - execute immediately (from profile)
         4. Everything else: queue for review
 
     Profile-based configuration:
@@ -33,9 +55,9 @@ class MixSubprocess:
         subprocess_dry_run: bool - log all, execute none
     """
 
-    # Command sets (populated by load_profile() and load_session_commands())
-    subprocess_auto_approve = set()  # Execute immediately (from profile)
-    subprocess_always_deny = set()  # Never execute (from profile)
+    # Command sets (replaced per instance by load_profile())
+    subprocess_auto_approve: frozenset[str] = frozenset()  # Execute immediately
+    subprocess_always_deny: frozenset[str] = frozenset()  # Never execute
 
     # Behavior
     subprocess_dry_run = False  # Log but don't execute
@@ -45,16 +67,22 @@ class MixSubprocess:
 
     # State
     subprocess_pending = []  # Commands awaiting approval
-    subprocess_approved = set()  # Commands approved this session
+    subprocess_approved: set[str]  # Commands approved this session (per instance)
     file_writes_pending = []  # File writes awaiting approval
     file_deletions_pending = []  # File/dir deletions awaiting approval
 
+    # Multiplexed SSH used when MixRemote has no connection (created on first use)
+    _fallback_ssh: SSHConnection | None = None
+
     # Execution tracking (populated during execution, NOT dry-run)
     # Note: Use _get_executed_commands() to access - ensures instance-level list
     _executed_commands: list[dict] | None = None
 
     # Persistence
     subprocess_auto_persist = True  # Auto-save pending when queuing
+    subprocess_persist_interval = 0.5  # Min seconds between queue file rewrites
+    _pending_saved_at = 0.0  # time.monotonic() of the last save_pending()
+    _pending_dirty = False  # Queued commands not yet written to the queue file
 
     # Session context (set by interact.py before run)
     subprocess_script_name = None  # str | None
@@ -63,23 +91,19 @@ class MixSubprocess:
     subprocess_analysis = None  # str | None
     subprocess_sandbox_args = {}  # dict - Structured args for re-execution
 
+    def __init__(self, *args, **kwds):
+        self.subprocess_approved = set()
+        self._build_decisions()
+        super().__init__(*args, **kwds)
+
+    def _build_decisions(self):
+        """Index the profile sets by command, with always_deny taking precedence."""
+        self._decisions = dict.fromkeys(self.subprocess_auto_approve, "allow")
+        self._decisions.update(dict.fromkeys(self.subprocess_always_deny, "deny"))
+
     def _parse_command(self, cmd):
         """Extract base command from shell string."""
-        # Handle pipes, redirects, etc.
-        parts = cmd.split()
-        if not parts:
-            return "", []
-
-        # Skip env vars like FOO=bar cmd
-        base = parts[0]
-        for p in parts:
-            if "=" not in p:
-                base = p
-                break
-
-        # Strip path
-        base = base.split("/")[-1]
-        return base, parts
+        return _base_command(cmd)
 
     def _check_permission(self, cmd):
         """
@@ -93,10 +117,11 @@ class MixSubprocess:
             3. auto_approve -> allow
             4. everything else -> queue
         """
-        base, parts = self._parse_command(cmd)
+        base = self._parse_command(cmd)
+        verdicts = (self._decisions.get(base), self._decisions.get(cmd))
 
         # 1. Check always_deny first (never run these)
-        if base in self.subprocess_always_deny or cmd in self.subprocess_always_deny:
+        if "deny" in verdicts:
             return "deny"
 
         # 2. Check if previously approved this session
@@ -104,7 +129,7 @@ class MixSubprocess:
             return "allow"
 
         # 3. Check auto_approve (profile-trusted commands)
-        if base in self.subprocess_auto_approve or cmd in self.subprocess_auto_approve:
+        if "allow" in verdicts:
             return "allow"
 
         # 4. Everything else queues for review
@@ -143,9 +168,14 @@ class MixSubprocess:
                 result = ssh.run(cmd)
                 return result.returncode
 
-            # Fallback: one-shot SSH connection
+            # Fallback: interactive ssh with output passed through, but
+            # multiplexed so consecutive commands share one handshake
+            if self._fallback_ssh is None:
+                from .ssh import SSHConnection
+
+                self._fallback_ssh = SSHConnection(self.remote_target)
             result = real_subprocess.run(
-                ["ssh", self.remote_target, cmd],
+                self._fallback_ssh.command_args(cmd, interactive=True),
                 shell=False,
             )
             return result.returncode
@@ -157,13 +187,12 @@ class MixSubprocess:
     @signature("system(p)i")
     def s_system(self: HasSandio, p_command):
         cmd = self.sandio.read_charp(p_command, 4096).decode("utf-8")
-        base, _ = self._parse_command(cmd)  # type: ignore[attr-defined]
+        base = self._parse_command(cmd)  # type: ignore[attr-defined]
 
         # Dry-run mode: log everything, execute nothing
         if self.subprocess_dry_run:  # type: ignore[attr-defined]
             self.subprocess_pending.append(cmd)  # type: ignore[attr-defined]
-            if self.subprocess_auto_persist:  # type: ignore[attr-defined]
-                self.save_pending()  # type: ignore[attr-defined]
+            self._persist_pending()  # type: ignore[attr-defined]
             sys.stderr.write(f"[DRY-RUN] {cmd}\n")
 
             # Audit log queued command in dry-run mode
@@ -198,8 +227,7 @@ class MixSubprocess:
 
         elif permission == "queue":
             self.subprocess_pending.append(cmd)  # type: ignore[attr-defined]
-            if self.subprocess_auto_persist:  # type: ignore[attr-defined]
-                self.save_pending()  # type: ignore[attr-defined]
+            self._persist_pending()  # type: ignore[attr-defined]
             sys.stderr.write(f"[QUEUED] {cmd}\n")
             # Audit log queued command
             from .audit import log_command_decision
@@ -256,8 +284,7 @@ class MixSubprocess:
 
     def approve_all_pending(self):
         """Approve all pending commands."""
-        for cmd in self.subprocess_pending:
-            self.subprocess_approved.add(cmd)
+        self.subprocess_approved.update(self.subprocess_pending)
         self.subprocess_pending.clear()
 
     def get_pending(self):
@@ -265,16 +292,47 @@ class MixSubprocess:
         return list(self.subprocess_pending)
 
     def load_profile(self):
-        """Load security profile into class attributes."""
+        """Load security profile into this instance's command sets."""
         from .config import load_config
 
         profile = load_config().profile
-        self.subprocess_auto_approve.update(profile.auto_approve)
-        self.subprocess_always_deny.update(profile.always_deny)
+        self.subprocess_auto_approve = frozenset(profile.auto_approve)
+        self.subprocess_always_deny = frozenset(profile.always_deny)
+        self._build_decisions()
+
+    def _persist_pending(self):
+        """
+        Auto-save the pending list after a command is queued.
+
+        The queue file is rewritten whole each time, so a script queueing
+        many commands would write O(n^2) bytes; saves are rate-limited and
+        run() flushes whatever is left once the sandbox exits.
+        """
+        if not self.subprocess_auto_persist:
+            return
+        self._pending_dirty = True
+        if time.monotonic() - self._pending_saved_at >= self.subprocess_persist_interval:
+            self.save_pending()
 
     def save_pending(self):
         """Write pending commands to queue file."""
+        from .queue import write_pending
+
         write_pending(self.subprocess_pending)
+        self._pending_saved_at = time.monotonic()
+        self._pending_dirty = False
+
+    def flush_pending(self):
+        """Write pending commands to queue file if an auto-save was skipped."""
+        if self._pending_dirty:
+            self.save_pending()
+
+    def run(self):
+        """Run the sandbox, then write any queued commands an auto-save skipped."""
+        try:
+            return super().run()  # type: ignore[misc]
+        finally:
+            self.flush_pending()
 
     def finalize_session(self):
         """
@@ -285,6 +343,8 @@ class MixSubprocess:
 
         Returns the created Session, or None if nothing was queued.
         """
+        self.flush_pending()
+
         if (
             not self.subprocess_pending
             and not self.file_writes_pending
@@ -332,5 +392,4 @@ class MixSubprocess:
 
         Use this when re-executing an approved session.
         """
-        for cmd in session.commands:
-            self.subprocess_approved.add(cmd)
+        self.subprocess_approved.update(session.commands)
@@ -16,4 +16,4 @@ DEFAULT_QUEUE = Path("/tmp/shannot-pending.json")
 
 def write_pending(commands: list[str], path: Path = DEFAULT_QUEUE):
     """Write pending commands to queue file."""
-    path.write_text(json.dumps(commands, indent=2))
+    path.write_text(json.dumps(commands, separators=(",", ":")))
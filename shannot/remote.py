@@ -136,8 +136,7 @@ def run_remote_dry_run(
         Session object with remote session data, or None if no commands queued
     """
     if script_content is None:
-        with open(script_path) as f:
-            script_content = f.read()
+        script_content = Path(script_path).read_text(encoding="utf-8")
 
     # Resolve target to (user, host, port)
     user, host, port = resolve_target(target)
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import hashlib
 import os
-import platform
 import shutil
 import ssl
 import sys
@@ -43,7 +42,7 @@ def get_ssl_context() -> ssl.SSLContext:
     ctx = ssl.create_default_context()
 
     # On macOS, try known certificate locations if default fails verification
-    if platform.system() == "Darwin":
+    if sys.platform == "darwin":
         # Common certificate locations on macOS
         cert_paths = [
             "/etc/ssl/cert.pem",  # Homebrew OpenSSL
@@ -81,8 +80,8 @@ def get_platform_tag() -> str | None:
     Returns:
         Platform tag (e.g., 'linux-amd64') or None if unsupported.
     """
-    system = platform.system().lower()
-    machine = platform.machine()
+    system = sys.platform
+    machine = os.uname().machine
 
     # Normalize machine names to match release asset naming
     if machine in ("x86_64", "AMD64"):
@@ -361,7 +360,7 @@ def download_sandbox(
     platform_tag = get_platform_tag()
     if not platform_tag:
         raise SetupError(
-            f"Unsupported platform: {platform.system()} {platform.machine()}\n"
+            f"Unsupported platform: {sys.platform} {os.uname().machine}\n"
             "Supported: Linux x86_64, Linux aarch64, macOS x86_64, macOS arm64\n"
             "You can build from source: https://github.com/corv89/pypy"
         )
@@ -68,7 +68,7 @@ def run_local_self_test() -> SelfTestResult:
 
         if result.returncode == 0:
             # Extract first line of script output (skip summary messages)
-            stdout = result.stdout.decode().strip()
+            stdout = result.stdout.decode("utf-8", errors="replace").strip()
             lines = [ln for ln in stdout.split("\n") if ln.strip() and not ln.startswith("***")]
             output = lines[0] if lines else ""
 
@@ -78,7 +78,7 @@ def run_local_self_test() -> SelfTestResult:
                 output=output,
             )
         else:
-            stderr = result.stderr.decode().strip()
+            stderr = result.stderr.decode("utf-8", errors="replace").strip()
             return SelfTestResult(
                 success=False,
                 elapsed_ms=elapsed_ms,
@@ -164,7 +164,7 @@ def run_remote_self_test(
 
             if result.returncode == 0:
                 # Extract first line of script output (skip summary messages)
-                stdout = result.stdout.decode().strip()
+                stdout = result.stdout.decode("utf-8", errors="replace").strip()
                 lines = [ln for ln in stdout.split("\n") if ln.strip() and not ln.startswith("***")]
                 output = lines[0] if lines else ""
 
@@ -174,7 +174,7 @@ def run_remote_self_test(
                     output=output,
                 )
             else:
-                stderr = result.stderr.decode().strip()
+                stderr = result.stderr.decode("utf-8", errors="replace").strip()
                 return SelfTestResult(
                     success=False,
                     elapsed_ms=elapsed_ms,
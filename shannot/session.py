@@ -66,6 +66,8 @@ class Session:
         return self.target is not None
 
     def __post_init__(self):
+        # Status as last read from or written to disk, for change auditing in save()
+        self._saved_status: str | None = None
         if not self.created_at:
             self.created_at = datetime.now().isoformat()
         if not self.expires_at:
@@ -333,16 +335,12 @@ class Session:
         self.session_dir.mkdir(parents=True, exist_ok=True)
         metadata_path = self.session_dir / "session.json"
 
-        # Detect status change for audit logging
-        old_status = None
-        if metadata_path.exists():
-            try:
-                old_data = json.loads(metadata_path.read_text())
-                old_status = old_data.get("status")
-            except (OSError, json.JSONDecodeError):
-                pass  # Ignore if file doesn't exist or is corrupt
+        # Detect status change for audit logging against the in-memory copy,
+        # rather than re-reading and re-parsing session.json before every write
+        old_status = self._saved_status
 
         metadata_path.write_text(json.dumps(asdict(self), indent=2))
+        self._saved_status = self.status
 
         # Log status change if detected
         if old_status and old_status != self.status:
@@ -370,6 +368,7 @@ class Session:
 
         data = json.loads(metadata_path.read_text())
         session = cls(**data)
+        session._saved_status = session.status
 
         if audit:
             from .audit import log_session_loaded
@@ -496,7 +495,8 @@ def execute_session(session: Session) -> int:
     Execute an approved session by re-running through the sandbox.
 
     This function delegates to run_session module for local sessions,
-    or to remote module for remote sessions.
+    or to remote module for remote sessions. Results (status, output,
+    completed writes) are set on ``session`` itself and saved to disk.
 
     Returns the exit code.
     """
@@ -59,14 +59,20 @@ class SSHConnection:
             config = SSHConfig(target=config)
         self.config = config
         self._connected = False
+        self._master_started = False  # A command may have opened the master
         self._registered_cleanup = False
 
     @property
     def target(self) -> str:
         return self.config.target
 
-    def _base_ssh_args(self) -> list[str]:
-        """Base SSH arguments with ControlMaster options."""
+    def _base_ssh_args(self, interactive: bool = False) -> list[str]:
+        """
+        Base SSH arguments with ControlMaster options.
+
+        Non-interactive connections never prompt and fail fast; interactive
+        ones leave password and host-key prompts to ssh's defaults.
+        """
         args = [
             "ssh",
             "-o",
@@ -75,18 +81,39 @@ class SSHConnection:
             f"ControlPath={self.config.control_path}",
             "-o",
             "ControlPersist=60",
-            "-o",
-            f"ConnectTimeout={self.config.connect_timeout}",
-            "-o",
-            "BatchMode=yes",  # Never prompt for password
-            "-o",
-            "StrictHostKeyChecking=accept-new",
         ]
+        if not interactive:
+            args += [
+                "-o",
+                f"ConnectTimeout={self.config.connect_timeout}",
+                "-o",
+                "BatchMode=yes",  # Never prompt for password
+                "-o",
+                "StrictHostKeyChecking=accept-new",
+            ]
         # Add port if non-default
         if self.config.port != 22:
             args.extend(["-p", str(self.config.port)])
         return args
 
+    def _register_cleanup(self) -> None:
+        """Close the ControlMaster at exit, however it was started."""
+        if not self._registered_cleanup:
+            atexit.register(self.disconnect)
+            self._registered_cleanup = True
+
+    def command_args(self, command: str, interactive: bool = False) -> list[str]:
+        """
+        Build the ssh argv for running a command over the shared connection.
+
+        With ControlMaster=auto the first invocation opens the master and
+        later ones reuse it, even if connect() was never called, so the
+        master is closed at exit like one opened by connect().
+        """
+        self._master_started = True
+        self._register_cleanup()
+        return self._base_ssh_args(interactive) + [self.config.target, command]
+
     def connect(self) -> bool:
         """
         Establish ControlMaster connection.
@@ -113,9 +140,7 @@ class SSHConnection:
             if result.returncode == 0:
                 self._connected = True
                 # Register cleanup on exit
-                if not self._registered_cleanup:
-                    atexit.register(self.disconnect)
-                    self._registered_cleanup = True
+                self._register_cleanup()
                 return True
             return False
         except subprocess.TimeoutExpired:
@@ -144,7 +169,7 @@ class SSHConnection:
         if timeout is None:
             timeout = self.config.command_timeout
 
-        args = self._base_ssh_args() + [self.config.target, command]
+        args = self.command_args(command)
 
         try:
             return subprocess.run(
@@ -308,7 +333,7 @@ class SSHConnection:
 
     def disconnect(self) -> None:
         """Close ControlMaster connection and clean up socket."""
-        if not self._connected:
+        if not (self._connected or self._master_started):
             return
 
         # Send exit command to ControlMaster
@@ -334,6 +359,7 @@ class SSHConnection:
             pass  # Socket already removed or inaccessible
 
         self._connected = False
+        self._master_started = False
 
     def __enter__(self):
         self.connect()
@@ -6,7 +6,7 @@ PyPy sandbox subprocess.
 
 from __future__ import annotations
 
-import platform
+import os
 import sys
 from ctypes import (
     Structure,
@@ -22,7 +22,7 @@ from ctypes import (
 )
 from typing import TYPE_CHECKING
 
-ARCH = platform.machine()
+ARCH = os.uname().machine
 IS_LINUX = sys.platform.startswith("linux")
 IS_MACOS = sys.platform == "darwin"
 
@@ -1,6 +1,5 @@
 import errno
 import os
-import platform
 import struct
 import sys
 import time
@@ -109,7 +108,7 @@ class VirtualizedProc:
     # ^^^ Aug 1st, 2019.  Subclasses can overwrite with a property
     # to get the current time dynamically, too
     virtual_hostname = "sandbox"
-    virtual_machine = platform.machine()  # "x86_64" or "aarch64"
+    virtual_machine = os.uname().machine  # "x86_64" or "aarch64"
     virtual_home = os.path.expanduser("~")  # Real user's home directory
     virtual_user = os.environ.get("USER", "user")  # Real username
 
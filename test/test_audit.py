@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import shutil
 import tempfile
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from unittest import mock
 
@@ -91,6 +91,21 @@ class TestAuditEvent:
         assert parsed["seq"] == 1
         assert parsed["event_type"] == "session_created"
 
+    def test_to_dict_matches_fields(self):
+        """to_dict covers every dataclass field."""
+        event = AuditEvent(
+            seq=2,
+            timestamp="2024-01-15T14:30:45.123456Z",
+            event_type="command_decision",
+            session_id=None,
+            host="localhost",
+            target="user@host",
+            user="testuser",
+            pid=1,
+            payload={"command": "ls"},
+        )
+        assert event.to_dict() == asdict(event)
+
 
 class TestAuditLogger:
     """Tests for audit logger."""
@@ -297,3 +312,25 @@ class TestConvenienceFunctions:
             assert len(log_files) == 0, "Session.list_all() should not audit"
         finally:
             shutil.rmtree(session_dir, ignore_errors=True)
+
+    def test_save_logs_status_change(self):
+        """Session.save() audits status changes made since the last load or save."""
+        from shannot.session import SESSIONS_DIR, Session
+
+        session = Session(id="test-session-status-change", name="test", script_path="/tmp/test.py")
+
+        try:
+            with mock.patch("shannot.audit.log_session_status_changed") as mock_log:
+                session.save()
+                mock_log.assert_not_called()
+
+                session.status = "rejected"
+                session.save()
+                mock_log.assert_called_once_with(session, "pending", "rejected")
+
+                loaded = Session.load(session.id, audit=False)
+                loaded.status = "approved"
+                loaded.save()
+                assert mock_log.call_args.args[1:] == ("rejected", "approved")
+        finally:
+            shutil.rmtree(SESSIONS_DIR / session.id, ignore_errors=True)
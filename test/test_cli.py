@@ -0,0 +1,136 @@
+"""Tests for the shannot command-line entry point."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from shannot import cli
+
+
+class TestSniffCommand:
+    """Tests for picking the subcommand out of argv before parsing."""
+
+    def test_first_positional_is_command(self):
+        assert cli._sniff_command(["setup", "remote", "list"]) == "setup"
+
+    def test_skips_leading_options(self):
+        assert cli._sniff_command(["--version", "run"]) == "run"
+
+    def test_no_command(self):
+        assert cli._sniff_command([]) is None
+
+    def test_top_level_help_builds_everything(self):
+        assert cli._sniff_command(["--help", "run"]) is None
+        assert cli._sniff_command(["-h"]) is None
+
+    def test_subcommand_help_is_not_top_level(self):
+        assert cli._sniff_command(["run", "--help"]) == "run"
+
+
+class TestMain:
+    """Tests for argument parsing and dispatch in main()."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_parsers(self):
+        # Cached parsers hold the cmd_* handlers they were built with; rebuild under mocks
+        with mock.patch.dict(cli._PARSERS, clear=True):
+            yield
+
+    def test_dispatches_invoked_command(self):
+        with (
+            mock.patch("sys.argv", ["shannot", "status", "--runtime"]),
+            mock.patch.object(cli, "cmd_status", return_value=0) as cmd_status,
+        ):
+            assert cli.main() == 0
+        args = cmd_status.call_args.args[0]
+        assert args.command == "status"
+        assert args.runtime is True
+
+    def test_nested_subcommand(self):
+        with (
+            mock.patch("sys.argv", ["shannot", "setup", "remote", "add", "prod", "example.com"]),
+            mock.patch.object(cli, "cmd_setup", return_value=0) as cmd_setup,
+        ):
+            assert cli.main() == 0
+        args = cmd_setup.call_args.args[0]
+        assert (args.remote_command, args.name, args.host, args.port) == (
+            "add",
+            "prod",
+            "example.com",
+            22,
+        )
+
+    def test_repeated_calls_reuse_parser(self):
+        with mock.patch.object(cli, "cmd_status", return_value=0) as cmd_status:
+            assert cli.main(["status", "--runtime"]) == 0
+            parser = cli._PARSERS["status"]
+            assert cli.main(["status", "--targets"]) == 0
+        assert cli._PARSERS["status"] is parser
+        first, second = (call.args[0] for call in cmd_status.call_args_list)
+        assert (first.runtime, first.targets) == (True, False)
+        assert (second.runtime, second.targets) == (False, True)
+
+    def test_run_forwards_options_to_interact(self):
+        argv = ["run", "--code", "print(1)", "--nocolor", "--tmp", "/tmp/x"]
+        argv += ["--pypy-sandbox", "/opt/pypy-sandbox", "--lib-path", "/opt/lib"]
+        with mock.patch("shannot.interact.main", return_value=0) as interact_main:
+            assert cli.main(argv) == 0
+        assert interact_main.call_args.args[0] == [
+            "--lib-path=/opt/lib",
+            "--dry-run",
+            "--tmp=/tmp/x",
+            "--nocolor",
+            "--code=print(1)",
+            "/opt/pypy-sandbox",
+            "-S",
+        ]
+
+    def test_unknown_command_lists_all_choices(self, capsys):
+        with mock.patch("sys.argv", ["shannot", "bogus"]), pytest.raises(SystemExit):
+            cli.main()
+        err = capsys.readouterr().err
+        for name in cli._COMMAND_PARSERS:
+            assert f"'{name}'" in err
+
+
+class TestImportSurface:
+    """Importing the CLI must not load what only individual commands need."""
+
+    # Loaded inside the cmd_* handlers that use them
+    DEFERRED_MODULES = (
+        "shannot.approve",
+        "shannot.config",
+        "shannot.interact",
+        "shannot.remote",
+        "shannot.runtime",
+        "shannot.session",
+        "shannot.ssh",
+        "shannot.virtualizedproc",
+    )
+
+    @staticmethod
+    def loaded_modules(module: str) -> set[str]:
+        # Fresh interpreter: this test process has imported most of shannot already
+        code = f"import json, sys, {module}; print(json.dumps(sorted(sys.modules)))"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent.parent,
+        )
+        return set(json.loads(result.stdout))
+
+    def test_import_cli_defers_command_modules(self):
+        loaded = self.loaded_modules("shannot.cli")
+        assert loaded.isdisjoint(self.DEFERRED_MODULES), loaded.intersection(self.DEFERRED_MODULES)
+
+    def test_import_interact_skips_typing(self):
+        # interact's usage path is meant to import nothing beyond sys
+        assert "typing" not in self.loaded_modules("shannot.interact")
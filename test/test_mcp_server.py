@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from unittest import mock
 
 from shannot.mcp.server import MCPServer
 from shannot.mcp.server_impl import ShannotMCPServer
@@ -114,6 +115,31 @@ class TestMCPServer:
         assert len(response["result"]["tools"]) == 1
         assert response["result"]["tools"][0]["name"] == "tool1"
 
+    def test_list_tools_reflects_later_registration(self):
+        """Test cached tools/list payload is rebuilt when a tool is registered."""
+        server = MCPServer(name="test", version="1.0.0")
+        request = {"jsonrpc": "2.0", "method": "tools/list", "id": 1}
+
+        server.register_tool(
+            name="tool1",
+            description="Tool 1",
+            input_schema={"type": "object"},
+            handler=lambda args: TextContent(text="result"),
+        )
+        first = server.handle_request(request)
+        assert first is not None
+        assert [t["name"] for t in first["result"]["tools"]] == ["tool1"]
+
+        server.register_tool(
+            name="tool2",
+            description="Tool 2",
+            input_schema={"type": "object"},
+            handler=lambda args: TextContent(text="result"),
+        )
+        second = server.handle_request(request)
+        assert second is not None
+        assert [t["name"] for t in second["result"]["tools"]] == ["tool1", "tool2"]
+
     def test_handle_call_tool(self):
         """Test tools/call request handling."""
         server = MCPServer(name="test", version="1.0.0")
@@ -156,6 +182,18 @@ class TestMCPServer:
         assert "error" in response
         assert "Unknown method" in response["error"]["message"]
 
+    def test_handle_unknown_notification(self):
+        """Test notifications without a handler are ignored without an error."""
+        server = MCPServer(name="test", version="1.0.0")
+
+        request = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+
+        with mock.patch("shannot.mcp.server.logger") as mock_logger:
+            response = server.handle_request(request)
+
+        assert response is None
+        mock_logger.error.assert_not_called()
+
 
 class TestShannotMCPServer:
     """Tests for ShannotMCPServer class."""
@@ -0,0 +1,136 @@
+"""Tests for subprocess permission handling in MixSubprocess."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+from shannot.config import Config, ProfileConfig
+from shannot.mix_subprocess import MixSubprocess
+
+
+def make_proc():
+    """MixSubprocess with its own state instead of the shared class-level containers."""
+    proc = MixSubprocess()
+    proc.subprocess_pending = []
+    proc.file_writes_pending = []
+    proc.file_deletions_pending = []
+    return proc
+
+
+def load_profile(proc, auto_approve, always_deny):
+    profile = ProfileConfig(auto_approve=auto_approve, always_deny=always_deny)
+    with mock.patch("shannot.config.load_config", return_value=Config(profile=profile)):
+        proc.load_profile()
+
+
+class TestCheckPermission:
+    """Tests for the deny / session-approved / auto-approve / queue tiers."""
+
+    def test_tiers(self):
+        proc = make_proc()
+        load_profile(proc, ["ls", "cat"], ["rm -rf /", "shutdown"])
+        assert proc._check_permission("/bin/ls -la") == "allow"
+        assert proc._check_permission("FOO=1 cat x") == "allow"
+        assert proc._check_permission("shutdown -h now") == "deny"
+        assert proc._check_permission("rm -rf /") == "deny"
+        assert proc._check_permission("rm -rf /tmp/x") == "queue"
+        proc.approve_command("rm -rf /tmp/x")
+        assert proc._check_permission("rm -rf /tmp/x") == "allow"
+
+    def test_deny_beats_allow(self):
+        proc = make_proc()
+        load_profile(proc, ["reboot", "ls"], ["reboot", "ls /root"])
+        proc.approve_command("reboot")
+        assert proc._check_permission("reboot") == "deny"
+        assert proc._check_permission("ls /root") == "deny"
+        assert proc._check_permission("ls /tmp") == "allow"
+
+    def test_instances_do_not_share_state(self):
+        first, second = make_proc(), make_proc()
+        load_profile(first, ["ls"], [])
+        first.approve_command("uptime")
+        assert second._check_permission("ls") == "queue"
+        assert second._check_permission("uptime") == "queue"
+        assert MixSubprocess.subprocess_auto_approve == frozenset()
+
+
+class TestPendingPersistence:
+    """Tests for rate-limited writes of the pending queue file."""
+
+    def test_saves_are_rate_limited(self):
+        proc = make_proc()
+        with (
+            mock.patch("shannot.queue.write_pending") as write_pending,
+            mock.patch("shannot.mix_subprocess.time.monotonic", return_value=100.0),
+        ):
+            for cmd in ("ls", "df -h", "uptime"):
+                proc.subprocess_pending.append(cmd)
+                proc._persist_pending()
+        assert write_pending.call_count == 1
+        assert proc._pending_dirty is True
+
+    def test_flush_writes_full_list(self):
+        proc = make_proc()
+        with (
+            mock.patch("shannot.queue.write_pending") as write_pending,
+            mock.patch("shannot.mix_subprocess.time.monotonic", return_value=100.0),
+        ):
+            for cmd in ("ls", "df -h"):
+                proc.subprocess_pending.append(cmd)
+                proc._persist_pending()
+            proc.flush_pending()
+            proc.flush_pending()
+        assert write_pending.call_count == 2
+        assert write_pending.call_args.args[0] == ["ls", "df -h"]
+
+    def test_run_flushes_skipped_save(self):
+        class Base:
+            def run(self):
+                for cmd in ("ls", "df -h"):
+                    self.subprocess_pending.append(cmd)
+                    self._persist_pending()
+
+        class Proc(MixSubprocess, Base):
+            pass
+
+        proc = Proc()
+        proc.subprocess_pending = []
+        with (
+            mock.patch("shannot.queue.write_pending") as write_pending,
+            mock.patch("shannot.mix_subprocess.time.monotonic", return_value=100.0),
+        ):
+            proc.run()
+        assert write_pending.call_args.args[0] == ["ls", "df -h"]
+        assert proc._pending_dirty is False
+
+    def test_auto_persist_disabled(self):
+        proc = make_proc()
+        proc.subprocess_auto_persist = False
+        with mock.patch("shannot.queue.write_pending") as write_pending:
+            proc.subprocess_pending.append("ls")
+            proc._persist_pending()
+            proc.flush_pending()
+        write_pending.assert_not_called()
+
+
+class TestFallbackSSH:
+    """Tests for running remote commands when MixRemote has no connection."""
+
+    def test_fallback_is_interactive_and_cleaned_up(self):
+        proc = make_proc()
+        proc.remote_target = "user@example.com"
+        with (
+            mock.patch("shannot.mix_subprocess.real_subprocess.run") as run,
+            mock.patch("shannot.ssh.atexit.register") as register,
+        ):
+            run.return_value.returncode = 3
+            assert proc._execute_command("uptime") == 3
+            assert proc._execute_command("df -h") == 3
+        args = run.call_args.args[0]
+        assert args[-2:] == ["user@example.com", "df -h"]
+        assert "ControlMaster=auto" in args
+        assert "BatchMode=yes" not in args
+        assert not any(a.startswith("StrictHostKeyChecking") for a in args)
+        register.assert_called_once_with(proc._fallback_ssh.disconnect)
+        # ssh was mocked, so there is no master for __del__ to close
+        proc._fallback_ssh._master_started = False
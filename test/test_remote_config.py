@@ -1,5 +1,6 @@
 """Tests for remote configuration management."""
 
+import os
 import shutil
 import tempfile
 from pathlib import Path
@@ -104,6 +105,21 @@ class TestRemotesConfig:
         """Removing non-existent remote returns False."""
         assert remove_remote("nonexistent") is False
 
+    def test_unchanged_file_is_parsed_once(self):
+        """Repeated loads reuse the parse until the file changes."""
+        add_remote("prod", "example.com", user="admin")
+        load_remotes()
+
+        with mock.patch("shannot.config.tomllib.load", side_effect=AssertionError):
+            assert load_remotes()["prod"].host == "example.com"
+
+        # Same size, so only the mtime tells the edit apart
+        config_path = Path(self.tmpdir) / "config.toml"
+        config_path.write_text(config_path.read_text().replace("example.com", "example.org"))
+        st = config_path.stat()
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert load_remotes()["prod"].host == "example.org"
+
 
 class TestResolveTarget:
     """Tests for resolve_target function."""